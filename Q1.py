@@ -1,14 +1,30 @@
 # Simple recursive DFS for an undirected graph (adjacency list)
 
+from csr import CSRGraph
+
 def dfs_recursive(graph, start, visited=None, result=None):
     """
     Perform a recursive depth-first search starting from `start`.
-    graph: dict where keys are vertices and values are lists of neighbors
+    graph: dict where keys are vertices and values are lists of neighbors,
+           or a CSRGraph (traversed over integer ids, see _dfs_csr_ids)
     start: vertex to begin DFS from
-    visited: set used to track visited vertices (internal use)
+    visited: set used to track visited vertices (internal use);
+             for a CSRGraph a bytearray of per-id flags
     result: list used to collect traversal order (internal use)
     Returns: list of vertices in the order they were visited
     """
+    if isinstance(graph, CSRGraph):
+        if result is None:
+            result = []
+        if start not in graph:
+            result.append(start)
+            return result
+        if visited is None:
+            visited = bytearray(len(graph))
+        labels = graph.labels
+        result.extend(labels[i] for i in _dfs_csr_ids(graph, graph.index[start], visited))
+        return result
+
     if visited is None:
         visited = set()
     if result is None:
@@ -26,6 +42,230 @@ def dfs_recursive(graph, start, visited=None, result=None):
     return result
 
 
+def _dfs_csr_ids(graph, start_id, visited):
+    """
+    Explicit-stack DFS over a CSRGraph's integer ids.
+    visited: bytearray of per-id flags, updated in place
+    Yields: ids in the same order dfs_recursive visits the labels
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    if visited[start_id]:
+        return
+    visited[start_id] = 1
+    yield start_id
+
+    # parallel stacks: vertex id and next position in its neighbor block
+    stack = [start_id]
+    pos = [offsets[start_id]]
+    while stack:
+        p = pos[-1]
+        end = offsets[stack[-1] + 1]
+        while p < end and visited[targets[p]]:
+            p += 1
+        if p == end:
+            stack.pop()
+            pos.pop()
+            continue
+        pos[-1] = p + 1
+        u = targets[p]
+        visited[u] = 1
+        yield u
+        stack.append(u)
+        pos.append(offsets[u])
+
+
+def dfs_iterative(graph, start, visited=None):
+    """
+    Depth-first search with an explicit stack instead of recursion.
+    Yields vertices lazily in exactly the same order as dfs_recursive,
+    so very deep graphs (long chains) never hit the recursion limit.
+    graph: dict where keys are vertices and values are lists of neighbors
+    start: vertex to begin DFS from
+    visited: optional set shared between calls (e.g. to cover all components)
+    Yields: vertices in the order they are visited
+    """
+    if visited is None:
+        visited = set()
+    if start in visited:
+        return
+
+    visited.add(start)
+    yield start
+
+    # Each stack entry is (vertex, iterator over its remaining neighbors);
+    # this is exactly the state the recursive version keeps on the call stack.
+    stack = [(start, iter(graph.get(start, [])))]
+    while stack:
+        _, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+        else:
+            # all neighbors handled -> "return" from this vertex
+            stack.pop()
+
+
+def dfs_events(graph, start, visited=None):
+    """
+    Explicit-stack DFS that reports traversal events instead of only vertices.
+    graph, start, visited: same as dfs_iterative
+    Yields tuples:
+      ("pre", v)        when v is first discovered (same order as dfs_recursive)
+      ("post", v)       when all of v's neighbors are finished
+      ("tree", u, v)    edge to an undiscovered vertex
+      ("back", u, v)    edge to a vertex still on the stack (an ancestor)
+      ("forward", u, v) edge to an already finished descendant
+      ("cross", u, v)   edge to a finished vertex in another subtree
+                        (or in an earlier component when visited is shared)
+    For an undirected graph every edge is seen from both ends, so the edge
+    back to the parent shows up as a "back" event.
+    """
+    if visited is None:
+        visited = set()
+    if start in visited:
+        return
+
+    discovered = {}   # vertex -> discovery time (only for this call)
+    finished = set()  # vertices whose "post" event was already emitted
+    clock = 0
+
+    visited.add(start)
+    discovered[start] = clock
+    clock += 1
+    yield ("pre", start)
+
+    stack = [(start, iter(graph.get(start, [])))]
+    while stack:
+        vertex, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                yield ("tree", vertex, neighbor)
+                visited.add(neighbor)
+                discovered[neighbor] = clock
+                clock += 1
+                yield ("pre", neighbor)
+                stack.append((neighbor, iter(graph.get(neighbor, []))))
+                break
+            # classify the non-tree edge
+            if neighbor not in discovered:
+                yield ("cross", vertex, neighbor)
+            elif neighbor not in finished:
+                yield ("back", vertex, neighbor)
+            elif discovered[neighbor] > discovered[vertex]:
+                yield ("forward", vertex, neighbor)
+            else:
+                yield ("cross", vertex, neighbor)
+        else:
+            stack.pop()
+            finished.add(vertex)
+            yield ("post", vertex)
+
+
+def dfs_all_components(graph, with_component=False):
+    """
+    Stream a DFS over the whole graph, including disconnected components.
+    Components are started in the order of `graph`'s keys, so the output is
+    the same as calling dfs_recursive on every unvisited vertex with a shared
+    visited set and result list.
+    graph: dict where keys are vertices and values are lists of neighbors,
+           or a CSRGraph (components then start in id order)
+    with_component: if True, yield (component_index, vertex) pairs instead
+    Yields: vertices (or (component_index, vertex)) in visit order
+    """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        seen = bytearray(len(graph))
+        component = 0
+        for i in range(len(graph)):
+            if not seen[i]:
+                for j in _dfs_csr_ids(graph, i, seen):
+                    yield (component, labels[j]) if with_component else labels[j]
+                component += 1
+        return
+
+    visited = set()
+    component = 0
+    for vertex in graph:
+        if vertex not in visited:
+            for v in dfs_iterative(graph, vertex, visited):
+                yield (component, v) if with_component else v
+            component += 1
+
+
+# ---------- Benchmark ----------
+
+def chain_graph(n):
+    """Path 0 - 1 - ... - n-1 (worst case for recursion depth)."""
+    graph = {i: [] for i in range(n)}
+    for i in range(n - 1):
+        graph[i].append(i + 1)
+        graph[i + 1].append(i)
+    return graph
+
+
+def star_graph(n):
+    """Vertex 0 connected to 1..n-1 (very wide, depth 1)."""
+    graph = {0: list(range(1, n))}
+    for i in range(1, n):
+        graph[i] = [0]
+    return graph
+
+
+def random_graph(n, avg_degree=4, seed=0):
+    """Random undirected graph with about n * avg_degree / 2 edges."""
+    import random
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for _ in range(n * avg_degree // 2):
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u != v:
+            graph[u].append(v)
+            graph[v].append(u)
+    return graph
+
+
+def benchmark(sizes=(1000, 10000, 100000), repeat=3):
+    """
+    Compare dfs_recursive with dfs_all_components on chain, star and random
+    graphs and print the best time of `repeat` runs for each.
+    The recursive version is reported as RecursionError when it fails.
+    """
+    import time
+
+    def best_time(func):
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - t0)
+        return best
+
+    def run_recursive(graph):
+        visited = set()
+        order = []
+        for vertex in graph:
+            if vertex not in visited:
+                dfs_recursive(graph, vertex, visited, order)
+        return order
+
+    print(f"{'graph':<8}{'n':>9}{'recursive (s)':>16}{'iterative (s)':>16}")
+    for name, make in (("chain", chain_graph), ("star", star_graph), ("random", random_graph)):
+        for n in sizes:
+            graph = make(n)
+            try:
+                assert run_recursive(graph) == list(dfs_all_components(graph))
+                rec = f"{best_time(lambda: run_recursive(graph)):.4f}"
+            except RecursionError:
+                rec = "RecursionError"
+            it = best_time(lambda: list(dfs_all_components(graph)))
+            print(f"{name:<8}{n:>9}{rec:>16}{it:>16.4f}")
+
+
 # Example usage:
 if __name__ == "__main__":
     # Undirected graph as adjacency list
@@ -45,11 +285,10 @@ if __name__ == "__main__":
     print("DFS starting from A:", traversal_from_A)
 
     # To traverse whole graph including disconnected components:
-    visited = set()
-    full_order = []
-    for vertex in graph:
-        if vertex not in visited:
-            # call dfs_recursive but share visited & result to accumulate
-            dfs_recursive(graph, vertex, visited, full_order)
-
+    full_order = list(dfs_all_components(graph))
     print("Full DFS order for all components:", full_order)
+
+    # Run with --bench to compare recursive and iterative DFS
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
@@ -1,12 +1,24 @@
 # Recursive BFS for an undirected graph (adjacency list)
 
+from array import array
+
+from csr import CSRGraph
+
 def bfs_recursive_from_start(graph, start):
     """
     Perform BFS starting from `start` using a recursive, level-by-level approach.
-    graph: dict where keys are vertices and values are lists of neighbors
+    graph: dict where keys are vertices and values are lists of neighbors,
+           or a CSRGraph (traversed over integer ids, see _bfs_csr_ids)
     start: starting vertex
     Returns: list of vertices in BFS order reachable from start
     """
+    if isinstance(graph, CSRGraph):
+        if start not in graph:
+            return [start]
+        labels = graph.labels
+        seen = bytearray(len(graph))
+        return [labels[i] for i in _bfs_csr_ids(graph, graph.index[start], seen)]
+
     visited = set()
     result = []
 
@@ -41,6 +53,15 @@ def bfs_recursive_full(graph):
     Perform BFS for the whole graph, covering disconnected components.
     Returns: list of vertices in the order they were visited (component by component)
     """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        seen = bytearray(len(graph))
+        full_result = []
+        for i in range(len(graph)):
+            if not seen[i]:
+                full_result.extend(labels[j] for j in _bfs_csr_ids(graph, i, seen))
+        return full_result
+
     visited = set()
     full_result = []
 
@@ -66,6 +87,337 @@ def bfs_recursive_full(graph):
     return full_result
 
 
+def bfs_tree(graph, start, max_depth=None, visited=None):
+    """
+    Iterative level-by-level BFS with O(1) frontier membership checks.
+    Visits vertices in the same order as bfs_recursive_from_start, but a
+    vertex is marked visited as soon as it is put on the next level, so
+    building a level is linear in its size (no `not in next_level` scan)
+    and no recursion is used across levels.
+    graph: dict where keys are vertices and values are lists of neighbors
+    start: starting vertex
+    max_depth: stop after this many levels (None = no limit)
+    visited: optional set shared between calls (e.g. to cover all components)
+    Returns: (order, distance, parent)
+      order: list of vertices in BFS order
+      distance: dict vertex -> number of edges from start
+      parent: dict vertex -> vertex it was discovered from (start -> None)
+    """
+    if visited is None:
+        visited = set()
+    if start in visited:
+        return [], {}, {}
+
+    visited.add(start)
+    order = [start]
+    distance = {start: 0}
+    parent = {start: None}
+
+    current_level = [start]
+    depth = 0
+    while current_level and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_level = []
+        for node in current_level:
+            for neighbor in graph.get(node, []):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    distance[neighbor] = depth
+                    parent[neighbor] = node
+                    next_level.append(neighbor)
+        order.extend(next_level)
+        current_level = next_level
+
+    return order, distance, parent
+
+
+def bfs_full(graph):
+    """
+    Whole-graph BFS using bfs_tree, same order as bfs_recursive_full.
+    Returns: list of vertices in the order they were visited (component by component)
+    """
+    visited = set()
+    full_result = []
+    for vertex in graph:
+        if vertex not in visited:
+            full_result.extend(bfs_tree(graph, vertex, visited=visited)[0])
+    return full_result
+
+
+def _bfs_csr_ids(graph, start_id, seen):
+    """
+    Level-by-level BFS over a CSRGraph's integer ids, same order as
+    bfs_level: a vertex is flagged in `seen` (a bytearray) when it is first
+    put on the next level, which replaces the `not in next_level` list scan.
+    Returns: list of ids in BFS order
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    seen[start_id] = 1
+    order = [start_id]
+    current_level = [start_id]
+    while current_level:
+        next_level = []
+        for node in current_level:
+            for p in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[p]
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    next_level.append(neighbor)
+        order.extend(next_level)
+        current_level = next_level
+    return order
+
+
+def multi_source_bfs(graph, sources, mode="nearest", alpha=14, beta=24, batch_size=512):
+    """
+    BFS from many sources at once, level by level like bfs_recursive_from_start.
+    Each level is expanded either top-down (scan the edges of the frontier)
+    or bottom-up (scan the unvisited vertices and look for a frontier
+    neighbor), switching to bottom-up when the frontier's edges exceed
+    1/alpha of the unexplored edges and back when the frontier shrinks
+    below 1/beta of the vertices. Bottom-up needs in-neighbors, so the
+    graph is assumed undirected as everywhere in Q1/Q2.
+    graph: dict of neighbor lists or a CSRGraph
+    sources: list of start vertices
+    mode:
+      "nearest"   -> every vertex gets its closest source
+                     (ties go to the source listed first)
+      "distances" -> one distance vector per source; sources are packed
+                     into int bitsets so one pass serves a whole batch
+    batch_size: sources per bitset pass in "distances" mode
+    Returns for a dict graph:
+      "nearest":   (nearest, distance) dicts vertex -> source / hops
+      "distances": dict source -> {vertex: hops}
+    For a CSRGraph the same results are indexed by vertex id instead:
+      arrays with -1 for unreachable vertices, nearest holding source ids.
+    """
+    is_csr = isinstance(graph, CSRGraph)
+    csr = graph if is_csr else CSRGraph.from_adjacency(graph)
+    for source in sources:
+        if source not in csr:
+            raise ValueError(f"source {source!r} is not in the graph")
+    source_ids = [csr.index[source] for source in sources]
+    labels = csr.labels
+
+    if mode == "nearest":
+        nearest, distance = _nearest_source_ids(csr, source_ids, alpha, beta)
+        if is_csr:
+            return nearest, distance
+        return ({labels[v]: labels[nearest[v]] for v in range(len(csr)) if distance[v] >= 0},
+                {labels[v]: distance[v] for v in range(len(csr)) if distance[v] >= 0})
+
+    if mode == "distances":
+        result = {}
+        for lo in range(0, len(source_ids), batch_size):
+            vectors = _multi_distance_ids(csr, source_ids[lo:lo + batch_size], alpha, beta)
+            for source, vector in zip(sources[lo:lo + batch_size], vectors):
+                if source in result:
+                    continue  # duplicate source, same vector
+                if is_csr:
+                    result[source] = vector
+                else:
+                    result[source] = {labels[v]: d for v, d in enumerate(vector) if d >= 0}
+        return result
+
+    raise ValueError(f"unknown mode {mode!r}")
+
+
+def _use_bottom_up(csr, frontier, unexplored_edges, bottom_up, alpha, beta):
+    """Direction-optimizing switch rule (frontier edges vs unexplored edges)."""
+    if bottom_up:
+        return len(frontier) * beta >= len(csr)
+    frontier_edges = sum(csr.offsets[v + 1] - csr.offsets[v] for v in frontier)
+    return frontier_edges * alpha > unexplored_edges
+
+
+def _nearest_source_ids(csr, source_ids, alpha, beta):
+    """Label every vertex id with the id of its nearest source and the distance."""
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    nearest = array('q', [-1]) * n
+    distance = array('q', [-1]) * n
+    rank = {}  # source id -> position in `sources`, for tie breaking
+    frontier = []
+    for position, s in enumerate(source_ids):
+        if distance[s] < 0:
+            rank[s] = position
+            nearest[s] = s
+            distance[s] = 0
+            frontier.append(s)
+
+    unexplored_edges = len(targets) - sum(offsets[v + 1] - offsets[v] for v in frontier)
+    bottom_up = False
+    depth = 0
+    while frontier:
+        depth += 1
+        bottom_up = _use_bottom_up(csr, frontier, unexplored_edges, bottom_up, alpha, beta)
+        next_level = []
+        if bottom_up:
+            for v in range(n):
+                if distance[v] >= 0:
+                    continue
+                best = -1
+                for p in range(offsets[v], offsets[v + 1]):
+                    u = targets[p]
+                    if distance[u] == depth - 1 and (best < 0 or rank[nearest[u]] < rank[best]):
+                        best = nearest[u]
+                if best >= 0:
+                    next_level.append(v)
+                    nearest[v] = best
+            for v in next_level:
+                distance[v] = depth
+        else:
+            for u in frontier:
+                label = nearest[u]
+                for p in range(offsets[u], offsets[u + 1]):
+                    v = targets[p]
+                    if distance[v] < 0:
+                        distance[v] = depth
+                        nearest[v] = label
+                        next_level.append(v)
+                    elif distance[v] == depth and rank[label] < rank[nearest[v]]:
+                        nearest[v] = label
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in next_level)
+        frontier = next_level
+    return nearest, distance
+
+
+def _multi_distance_ids(csr, source_ids, alpha, beta):
+    """
+    Distance vectors for a batch of sources in one level-synchronous pass.
+    seen[v] and reach[v] are Python ints used as bitsets: bit i set means
+    source i has reached v (ever / at the current level).
+    Returns: list of arrays, one per source, -1 for unreachable
+    """
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    everything = (1 << len(source_ids)) - 1
+    vectors = [array('q', [-1]) * n for _ in source_ids]
+    seen = [0] * n
+    reach = [0] * n
+    for i, s in enumerate(source_ids):
+        seen[s] |= 1 << i
+        reach[s] |= 1 << i
+        vectors[i][s] = 0
+    frontier = sorted(set(source_ids))
+
+    unexplored_edges = len(targets)
+    bottom_up = False
+    depth = 0
+    while frontier:
+        depth += 1
+        bottom_up = _use_bottom_up(csr, frontier, unexplored_edges, bottom_up, alpha, beta)
+        fresh = {}
+        if bottom_up:
+            for v in range(n):
+                missing = everything & ~seen[v]
+                if not missing:
+                    continue
+                bits = 0
+                for p in range(offsets[v], offsets[v + 1]):
+                    bits |= reach[targets[p]]
+                    if bits & missing == missing:
+                        break
+                bits &= missing
+                if bits:
+                    fresh[v] = bits
+        else:
+            for u in frontier:
+                bits = reach[u]
+                for p in range(offsets[u], offsets[u + 1]):
+                    v = targets[p]
+                    new = bits & ~seen[v]
+                    if new:
+                        fresh[v] = fresh.get(v, 0) | new
+
+        for u in frontier:
+            reach[u] = 0
+        for v, bits in fresh.items():
+            if seen[v] | bits == everything:
+                unexplored_edges -= offsets[v + 1] - offsets[v]
+            seen[v] |= bits
+            reach[v] = bits
+            while bits:
+                low = bits & -bits
+                vectors[low.bit_length() - 1][v] = depth
+                bits ^= low
+        frontier = list(fresh)
+    return vectors
+
+
+# ---------- Benchmark ----------
+
+def wide_graph(width, layers=3):
+    """
+    Layered graph where every vertex of one layer is connected to every
+    vertex of the next: a single huge frontier per level.
+    Vertices are (layer, i); layer 0 has just the root (0, 0).
+    """
+    graph = {(0, 0): []}
+    previous = [(0, 0)]
+    for layer in range(1, layers + 1):
+        current = [(layer, i) for i in range(width)]
+        for v in current:
+            graph[v] = list(previous)
+        for u in previous:
+            graph[u].extend(current)
+        previous = current
+    return graph
+
+
+def benchmark(widths=(100, 200, 400, 800), layers=3):
+    """
+    Time bfs_recursive_from_start against bfs_tree on wide graphs.
+    Doubling the width quadruples the edges; the old version also scans
+    the next level list per edge, so it grows much faster than bfs_tree.
+    """
+    import time
+
+    print(f"{'width':>7}{'edges':>10}{'recursive (s)':>16}{'bfs_tree (s)':>15}")
+    for width in widths:
+        graph = wide_graph(width, layers)
+        edges = sum(len(nbrs) for nbrs in graph.values())
+        t0 = time.perf_counter()
+        expected = bfs_recursive_from_start(graph, (0, 0))
+        t1 = time.perf_counter()
+        order = bfs_tree(graph, (0, 0))[0]
+        t2 = time.perf_counter()
+        assert order == expected
+        print(f"{width:>7}{edges:>10}{t1 - t0:>16.4f}{t2 - t1:>15.4f}")
+
+
+def benchmark_multi_source(n=20000, avg_degree=8, num_sources=256, seed=0):
+    """
+    Compare one bfs_tree call per source with a single multi_source_bfs
+    pass (distance vectors for every source) on a random graph.
+    """
+    import random
+    import time
+    from Q1 import random_graph
+
+    graph = random_graph(n, avg_degree, seed)
+    csr = CSRGraph.from_adjacency(graph)
+    sources = random.Random(seed).sample(range(n), num_sources)
+
+    t0 = time.perf_counter()
+    single = {s: bfs_tree(graph, s)[1] for s in sources}
+    t1 = time.perf_counter()
+    multi = multi_source_bfs(csr, sources, mode="distances")
+    t2 = time.perf_counter()
+    multi_source_bfs(csr, sources, mode="nearest")
+    t3 = time.perf_counter()
+
+    for s in sources:
+        assert all(multi[s][csr.index[v]] == d for v, d in single[s].items())
+    print(f"{num_sources} sources on {n} vertices:")
+    print(f"  bfs_tree per source:    {t1 - t0:.3f} s")
+    print(f"  multi_source distances: {t2 - t1:.3f} s")
+    print(f"  multi_source nearest:   {t3 - t2:.3f} s")
+
+
 # Example usage
 if __name__ == "__main__":
     graph = {
@@ -80,3 +432,15 @@ if __name__ == "__main__":
 
     print("BFS from A:", bfs_recursive_from_start(graph, 'A'))
     print("Full BFS over all components:", bfs_recursive_full(graph))
+
+    order, distance, parent = bfs_tree(graph, 'A', max_depth=1)
+    print("BFS from A, depth <= 1:", order, distance, parent)
+
+    nearest, hops = multi_source_bfs(graph, ['A', 'F'])
+    print("Nearest of A/F:", nearest, hops)
+
+    # Run with --bench to compare against the list-scan version
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_multi_source()
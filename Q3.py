@@ -1,7 +1,46 @@
 '''Implement A star (A*) Algorithm for any game search problem.'''
 # Simple A* algorithm on a grid (easy to understand)
 
-def a_star(grid, start, goal):
+import heapq
+import math
+import time
+
+
+def a_star(grid, start, goal, mode=None, stats=None, weight=1.0):
+    """
+    Shortest path from start to goal.
+    grid: list of rows (0 = free cell, 1 = obstacle), searched with
+          4-directional moves; or a search problem such as
+          GridProblem(grid, moves=8) (anything with neighbors / cost /
+          heuristic methods, see search)
+    mode: open set for a plain grid:
+          "list" (default) -> simple open list scanned with min() (below)
+          "heap" -> binary-heap open set with lazy deletion (a_star_heap)
+          A search problem or weight != 1 always runs the heap-based
+          search(); mode "list" raises ValueError there.
+    stats: optional dict that receives counters: "expanded" nodes,
+           "pushed" open-set insertions and wall-clock "seconds"
+    weight: > 1 runs weighted A* (path cost at most weight * optimal)
+    Returns: list of cells from start to goal, or None if no path
+    """
+    if hasattr(grid, "neighbors") or weight != 1.0:
+        if mode not in (None, "heap"):
+            raise ValueError(f"mode {mode!r} is only supported for a plain grid "
+                             f"with weight 1; use mode='heap' or leave it out")
+        problem = grid if hasattr(grid, "neighbors") else GridProblem(grid)
+        return search(problem, start, goal, weight, stats)
+    if mode is None:
+        mode = "list"
+    if mode == "heap":
+        return a_star_heap(grid, start, goal, stats)
+    if mode != "list":
+        raise ValueError(f"unknown mode {mode!r}")
+
+    t0 = time.perf_counter()
+    counters = {"expanded": 0, "pushed": 1}
+    if stats is not None:
+        stats.update(counters)
+
     rows, cols = len(grid), len(grid[0])
     open_list = [start]      # nodes to visit
     came_from = {}           # to reconstruct path
@@ -14,9 +53,12 @@ def a_star(grid, start, goal):
         
         # Goal reached
         if current == goal:
+            if stats is not None:
+                stats.update(counters, seconds=time.perf_counter() - t0)
             return reconstruct_path(came_from, current)
         
         open_list.remove(current)
+        counters["expanded"] += 1
         r, c = current
 
         # Check 4-directional neighbors
@@ -39,15 +81,354 @@ def a_star(grid, start, goal):
                 f[neighbor] = tentative_g + heuristic(neighbor, goal)
                 if neighbor not in open_list:
                     open_list.append(neighbor)
+                    counters["pushed"] += 1
 
+    if stats is not None:
+        stats.update(counters, seconds=time.perf_counter() - t0)
     return None  # no path found
 
 
+def a_star_heap(grid, start, goal, stats=None):
+    """
+    A* with a binary heap (heapq) as open set and a closed set.
+    Instead of removing or re-prioritizing entries, a better path just
+    pushes a new entry; stale entries are skipped when popped (lazy
+    deletion). Ties on f are broken on the smaller h, i.e. the node closer
+    to the goal. Same inputs, output and path length as a_star.
+    stats: optional dict, receives "expanded", "pushed", "stale" and "seconds"
+    """
+    t0 = time.perf_counter()
+    rows, cols = len(grid), len(grid[0])
+    came_from = {}
+    g = {start: 0}
+    closed = set()
+    h = heuristic(start, goal)
+    open_heap = [(h, h, start)]  # (f, h, node)
+    expanded = stale = 0
+    pushed = 1
+    path = None
+
+    while open_heap:
+        _, _, current = heapq.heappop(open_heap)
+        if current in closed:
+            stale += 1  # an older, worse entry for a node already expanded
+            continue
+        if current == goal:
+            path = reconstruct_path(came_from, current)
+            break
+
+        closed.add(current)
+        expanded += 1
+        r, c = current
+        g_next = g[current] + 1
+
+        for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
+            nr, nc = r + dr, c + dc
+            if not (0 <= nr < rows and 0 <= nc < cols) or grid[nr][nc] == 1:
+                continue
+            neighbor = (nr, nc)
+            if neighbor in closed:
+                continue
+            if g_next < g.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g[neighbor] = g_next
+                h = heuristic(neighbor, goal)
+                heapq.heappush(open_heap, (g_next + h, h, neighbor))
+                pushed += 1
+
+    if stats is not None:
+        stats.update(expanded=expanded, pushed=pushed, stale=stale,
+                     seconds=time.perf_counter() - t0)
+    return path
+
+
+class GridProblem:
+    """
+    Grid search problem for a_star / search.
+    grid: list of rows, 0 = free cell, 1 = obstacle
+    moves: 4 (up/down/left/right) or 8 (also diagonals; a diagonal step
+           is only allowed when both cells it passes are free)
+    costs: optional matrix of per-cell costs, the price of entering a cell
+           (default 1); a diagonal step costs sqrt(2) times as much
+    heuristic: "manhattan", "octile", "euclidean" or "chebyshev"
+           (default: manhattan for 4 moves, octile for 8 moves)
+    The heuristic is scaled by the cheapest cell cost so it stays
+    admissible on weighted maps (manhattan is only admissible for 4 moves).
+    """
+
+    DIRECTIONS_4 = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    DIRECTIONS_8 = DIRECTIONS_4 + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+    def __init__(self, grid, moves=4, costs=None, heuristic=None):
+        if moves not in (4, 8):
+            raise ValueError("moves must be 4 or 8")
+        self.grid = grid
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.moves = moves
+        self.directions = self.DIRECTIONS_4 if moves == 4 else self.DIRECTIONS_8
+        self.costs = costs
+        if costs is None:
+            self.min_cost = 1
+        else:
+            free = [costs[r][c] for r in range(self.rows) for c in range(self.cols)
+                    if grid[r][c] == 0]
+            self.min_cost = min(free) if free else 1
+        if heuristic is None:
+            heuristic = "manhattan" if moves == 4 else "octile"
+        self.distance = DISTANCES[heuristic]
+
+    def free(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols and self.grid[r][c] == 0
+
+    def neighbors(self, node):
+        r, c = node
+        for dr, dc in self.directions:
+            nr, nc = r + dr, c + dc
+            if not self.free(nr, nc):
+                continue
+            if dr and dc and not (self.free(r + dr, c) and self.free(r, c + dc)):
+                continue  # no cutting corners past an obstacle
+            yield (nr, nc)
+
+    def cost(self, a, b):
+        step = 1 if self.costs is None else self.costs[b[0]][b[1]]
+        if a[0] != b[0] and a[1] != b[1]:
+            return step * math.sqrt(2)
+        return step
+
+    def heuristic(self, a, goal):
+        return self.min_cost * self.distance(a, goal)
+
+
+def octile(a, b):
+    # exact distance on an empty 8-way grid with diagonal cost sqrt(2)
+    dr, dc = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dr, dc) + (math.sqrt(2) - 1) * min(dr, dc)
+
+
+def euclidean(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def chebyshev(a, b):
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+def search(problem, start, goal, weight=1.0, stats=None):
+    """
+    Heap-based A* over any search problem providing:
+      problem.neighbors(node) -> iterable of successor nodes
+      problem.cost(a, b)      -> cost of the step a -> b
+      problem.heuristic(a, goal) -> admissible estimate of the remaining cost
+    weight: f = g + weight * h; weight > 1 is weighted A*, which usually
+            expands far fewer nodes and returns a path whose cost is at
+            most `weight` times the optimum (nodes are not reopened)
+    stats: optional dict, receives "expanded", "pushed", "stale", "cost"
+           and "seconds"
+    Returns: list of nodes from start to goal, or None if no path
+    """
+    t0 = time.perf_counter()
+    came_from = {}
+    g = {start: 0}
+    closed = set()
+    h = problem.heuristic(start, goal)
+    counter = 0  # keeps heap entries comparable without comparing nodes
+    open_heap = [(weight * h, h, counter, start)]
+    expanded = stale = 0
+    pushed = 1
+    path = None
+
+    while open_heap:
+        _, _, _, current = heapq.heappop(open_heap)
+        if current in closed:
+            stale += 1
+            continue
+        if current == goal:
+            path = reconstruct_path(came_from, current)
+            break
+
+        closed.add(current)
+        expanded += 1
+        for neighbor in problem.neighbors(current):
+            if neighbor in closed:
+                continue
+            tentative_g = g[current] + problem.cost(current, neighbor)
+            if tentative_g < g.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g[neighbor] = tentative_g
+                h = problem.heuristic(neighbor, goal)
+                counter += 1
+                heapq.heappush(open_heap, (tentative_g + weight * h, h, counter, neighbor))
+                pushed += 1
+
+    if stats is not None:
+        stats.update(expanded=expanded, pushed=pushed, stale=stale,
+                     cost=g[goal] if path else None,
+                     seconds=time.perf_counter() - t0)
+    return path
+
+
+def jump_point_search(grid, start, goal, stats=None):
+    """
+    Jump Point Search on a uniform-cost 8-way grid (same model as
+    GridProblem(grid, moves=8): diagonal steps cost sqrt(2) and may not cut
+    corners). Instead of pushing every neighbor it "jumps" in a straight or
+    diagonal line until it reaches a cell where an optimal path could turn
+    (a jump point), so the symmetric paths of open areas are never expanded.
+    grid, start, goal: same as a_star
+    stats: optional dict, receives "expanded", "pushed", "cost" and "seconds"
+    Returns: full list of cells from start to goal (intermediate cells
+             included, like reconstruct_path), or None if no path
+    """
+    t0 = time.perf_counter()
+    rows, cols = len(grid), len(grid[0])
+
+    def free(r, c):
+        return 0 <= r < rows and 0 <= c < cols and grid[r][c] == 0
+
+    came_from = {}
+    g = {start: 0}
+    closed = set()
+    h = octile(start, goal)
+    open_heap = [(h, h, start)]
+    expanded = 0
+    pushed = 1
+    path = None
+    if not free(*start) or not free(*goal):
+        open_heap = []
+
+    while open_heap:
+        _, _, current = heapq.heappop(open_heap)
+        if current in closed:
+            continue
+        if current == goal:
+            path = _expand_jumps(reconstruct_path(came_from, current))
+            break
+
+        closed.add(current)
+        expanded += 1
+        for dr, dc in _jps_directions(free, current, came_from.get(current)):
+            point = _jump(free, current[0] + dr, current[1] + dc, dr, dc, goal)
+            if point is None or point in closed:
+                continue
+            tentative_g = g[current] + octile(current, point)
+            if tentative_g < g.get(point, float('inf')):
+                came_from[point] = current
+                g[point] = tentative_g
+                h = octile(point, goal)
+                heapq.heappush(open_heap, (tentative_g + h, h, point))
+                pushed += 1
+
+    if stats is not None:
+        stats.update(expanded=expanded, pushed=pushed,
+                     cost=g[goal] if path else None,
+                     seconds=time.perf_counter() - t0)
+    return path
+
+
+def _jps_directions(free, node, parent):
+    """Directions worth exploring from `node` after arriving from `parent`."""
+    r, c = node
+    if parent is None:
+        # start node: every legal move
+        return [(dr, dc) for dr, dc in GridProblem.DIRECTIONS_8
+                if free(r + dr, c + dc)
+                and (not (dr and dc) or (free(r + dr, c) and free(r, c + dc)))]
+
+    dr = (r > parent[0]) - (r < parent[0])
+    dc = (c > parent[1]) - (c < parent[1])
+    directions = []
+    if dr and dc:
+        # diagonal: keep going, plus the two straight components
+        if free(r + dr, c):
+            directions.append((dr, 0))
+        if free(r, c + dc):
+            directions.append((0, dc))
+        if free(r + dr, c) and free(r, c + dc):
+            directions.append((dr, dc))
+    elif dc:
+        # horizontal: straight on, plus turns only towards forced neighbors
+        # (the same test as in _jump: a free cell beside us whose cell
+        # behind is blocked); every other side cell has an equally short
+        # path that does not pass through this node
+        ahead = free(r, c + dc)
+        if ahead:
+            directions.append((0, dc))
+        for s in (-1, 1):
+            if free(r + s, c) and not free(r + s, c - dc):
+                directions.append((s, 0))
+                if ahead:
+                    directions.append((s, dc))
+    else:
+        # vertical: the same with rows and columns swapped
+        ahead = free(r + dr, c)
+        if ahead:
+            directions.append((dr, 0))
+        for s in (-1, 1):
+            if free(r, c + s) and not free(r - dr, c + s):
+                directions.append((0, s))
+                if ahead:
+                    directions.append((dr, s))
+    return directions
+
+
+def _jump(free, r, c, dr, dc, goal):
+    """
+    Walk from (r, c) in direction (dr, dc) until a jump point is found.
+    Returns the jump point, or None when the walk hits an obstacle/edge.
+    """
+    while True:
+        if not free(r, c):
+            return None
+        if (r, c) == goal:
+            return (r, c)
+        if dr and dc:
+            # a diagonal cell is a jump point if a straight jump from it finds one
+            if _jump(free, r, c + dc, 0, dc, goal) or _jump(free, r + dr, c, dr, 0, goal):
+                return (r, c)
+            if not (free(r + dr, c) and free(r, c + dc)):
+                return None  # cannot continue diagonally past a corner
+        elif dc:
+            # forced neighbor: a cell beside us that could not be reached
+            # diagonally from the previous cell because of an obstacle
+            if (free(r - 1, c) and not free(r - 1, c - dc)) or \
+                    (free(r + 1, c) and not free(r + 1, c - dc)):
+                return (r, c)
+        else:
+            if (free(r, c - 1) and not free(r - dr, c - 1)) or \
+                    (free(r, c + 1) and not free(r - dr, c + 1)):
+                return (r, c)
+        r += dr
+        c += dc
+
+
+def _expand_jumps(points):
+    """Fill in the cells between consecutive jump points (straight or diagonal runs)."""
+    path = [points[0]]
+    for (r1, c1) in points[1:]:
+        r, c = path[-1]
+        dr = (r1 > r) - (r1 < r)
+        dc = (c1 > c) - (c1 < c)
+        while (r, c) != (r1, c1):
+            r += dr
+            c += dc
+            path.append((r, c))
+    return path
+
+
 def heuristic(a, b):
     # Manhattan distance (works for 4-direction grid)
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
+DISTANCES = {
+    "manhattan": heuristic,
+    "octile": octile,
+    "euclidean": euclidean,
+    "chebyshev": chebyshev,
+}
+
+
 def reconstruct_path(came_from, current):
     path = [current]
     while current in came_from:
@@ -57,6 +438,132 @@ def reconstruct_path(came_from, current):
     return path
 
 
+# ---------- Benchmark ----------
+
+def random_grid(rows, cols, density=0.25, seed=0):
+    """Grid with about `density` of the cells blocked (corners kept free)."""
+    import random
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+    grid[0][0] = grid[rows - 1][cols - 1] = 0
+    return grid
+
+
+def benchmark(sizes=(50, 100, 200), density=0.25, seed=0, modes=("list", "heap")):
+    """
+    Run every mode corner to corner on random-obstacle grids and print
+    path length, expanded nodes and wall-clock time side by side.
+    """
+    print(f"{'size':>6}{'mode':>7}{'length':>8}{'expanded':>10}{'seconds':>10}")
+    for size in sizes:
+        grid = random_grid(size, size, density, seed)
+        for mode in modes:
+            stats = {}
+            path = a_star(grid, (0, 0), (size - 1, size - 1), mode=mode, stats=stats)
+            length = len(path) - 1 if path else None
+            print(f"{size:>6}{mode:>7}{str(length):>8}{stats['expanded']:>10}"
+                  f"{stats['seconds']:>10.4f}")
+
+
+def random_costs(rows, cols, low=1, high=5, seed=0):
+    """Per-cell move costs drawn uniformly from low..high."""
+    import random
+    rng = random.Random(seed)
+    return [[rng.randint(low, high) for _ in range(cols)] for _ in range(rows)]
+
+
+def benchmark_models(size=150, density=0.2, seed=0):
+    """
+    Compare movement models and weighted A* on one random weighted map:
+    expansions, path cost and time for each configuration.
+    """
+    grid = random_grid(size, size, density, seed)
+    costs = random_costs(size, size, seed=seed)
+    start, goal = (0, 0), (size - 1, size - 1)
+    configs = [
+        ("4-way manhattan", GridProblem(grid, 4, costs), 1.0),
+        ("8-way octile", GridProblem(grid, 8, costs, "octile"), 1.0),
+        ("8-way euclidean", GridProblem(grid, 8, costs, "euclidean"), 1.0),
+        ("8-way chebyshev", GridProblem(grid, 8, costs, "chebyshev"), 1.0),
+        ("8-way octile w=1.5", GridProblem(grid, 8, costs, "octile"), 1.5),
+        ("8-way octile w=3", GridProblem(grid, 8, costs, "octile"), 3.0),
+    ]
+    print(f"{'model':<22}{'expanded':>10}{'cost':>10}{'seconds':>10}")
+    for name, problem, weight in configs:
+        stats = {}
+        search(problem, start, goal, weight, stats)
+        cost = "-" if stats["cost"] is None else f"{stats['cost']:.2f}"
+        print(f"{name:<22}{stats['expanded']:>10}{cost:>10}{stats['seconds']:>10.4f}")
+
+
+def maze_grid(rows, cols, seed=0):
+    """
+    Maze-like grid (odd sizes work best): corridors one cell wide carved by
+    a randomized depth-first search from (0, 0).
+    """
+    import random
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+    grid[0][0] = 0
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(dr, dc) for dr, dc in [(-2, 0), (2, 0), (0, -2), (0, 2)]
+                   if 0 <= r + dr < rows and 0 <= c + dc < cols and grid[r + dr][c + dc] == 1]
+        if not options:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(options)
+        grid[r + dr // 2][c + dc // 2] = 0
+        grid[r + dr][c + dc] = 0
+        stack.append((r + dr, c + dc))
+    return grid
+
+
+def verify_jps(trials=200, size=30, seed=0):
+    """
+    Correctness check: on random grids, jump_point_search must find a path
+    exactly when a_star with the 8-way model does, with the same cost,
+    and the path must be a chain of legal moves.
+    """
+    import random
+    rng = random.Random(seed)
+    for trial in range(trials):
+        grid = random_grid(size, size, rng.choice([0.0, 0.1, 0.25, 0.4]), seed + trial)
+        problem = GridProblem(grid, moves=8)
+        start = (rng.randrange(size), rng.randrange(size))
+        goal = (rng.randrange(size), rng.randrange(size))
+        grid[start[0]][start[1]] = grid[goal[0]][goal[1]] = 0
+        expected, got = {}, {}
+        search(problem, start, goal, stats=expected)
+        path = jump_point_search(grid, start, goal, stats=got)
+        if expected["cost"] is None:
+            assert path is None, trial
+            continue
+        assert abs(got["cost"] - expected["cost"]) < 1e-9, trial
+        assert path[0] == start and path[-1] == goal
+        assert all(b in set(problem.neighbors(a)) for a, b in zip(path, path[1:])), trial
+    print(f"jump_point_search matched a_star on {trials} random grids")
+
+
+def benchmark_jps(size=301, seed=0):
+    """Compare 8-way A* and jump_point_search on large open and maze grids."""
+    grids = [("open", random_grid(size, size, 0.03, seed)),
+             ("maze", maze_grid(size, size, seed))]
+    print(f"{'grid':<6}{'method':>8}{'expanded':>10}{'cost':>10}{'seconds':>10}")
+    for name, grid in grids:
+        start, goal = (0, 0), (size - 1, size - 1)
+        for method in ("a_star", "jps"):
+            stats = {}
+            if method == "a_star":
+                search(GridProblem(grid, moves=8), start, goal, stats=stats)
+            else:
+                jump_point_search(grid, start, goal, stats=stats)
+            cost = "-" if stats["cost"] is None else f"{stats['cost']:.2f}"
+            print(f"{name:<6}{method:>8}{stats['expanded']:>10}{cost:>10}"
+                  f"{stats['seconds']:>10.4f}")
+
+
 # Example usage
 if __name__ == "__main__":
     # 0 = free cell, 1 = obstacle
@@ -76,3 +583,17 @@ if __name__ == "__main__":
         print("Path found:", path)
     else:
         print("No path found.")
+
+    # Same map with diagonal moves
+    path8 = a_star(GridProblem(grid, moves=8), start, goal)
+    print("8-way path found:", path8)
+    print("Jump point search path:", jump_point_search(grid, start, goal))
+
+    # Run with --bench to compare the list and heap open sets
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_models()
+        benchmark_jps()
+    if "--check" in sys.argv:
+        verify_jps()
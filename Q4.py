@@ -2,12 +2,17 @@
 Implement a solution for a Constraint Satisfaction Problem using Branch and Bound for
 n-queens problem.
 '''
-def solve_n_queens(n):
+import heapq
+
+
+def solve_n_queens(n, stats=None):
     """
     Solve the n-queens problem using recursive branch-and-bound (backtracking with pruning).
     Returns a list of solutions. Each solution is a list of column indices;
     solution[row] = column where a queen is placed in that row.
+    stats: optional dict, receives "nodes" (calls of place) for comparisons
     """
+    nodes = 0
     solutions = []           # will collect all valid solutions
     cols = set()             # columns that are already occupied
     diag1 = set()            # r - c for occupied major diagonals
@@ -15,6 +20,8 @@ def solve_n_queens(n):
     partial = []             # partial solution: list of columns for rows 0..row-1
 
     def place(row):
+        nonlocal nodes
+        nodes += 1
         # If we've placed queens on all rows, record the solution
         if row == n:
             solutions.append(partial.copy())
@@ -43,9 +50,156 @@ def solve_n_queens(n):
 
     # Start recursion from row 0
     place(0)
+    if stats is not None:
+        stats["nodes"] = nodes
     return solutions
 
 
+def solve_weighted_n_queens(scores, mode="depth", stats=None):
+    """
+    Weighted n-queens with real branch and bound: place one queen per row
+    (no two attacking) so that the sum of scores[row][col] is maximal.
+    scores: n x n matrix of cell scores
+    mode: "depth" -> depth-first, most promising column first
+          "best"  -> best-first, always expand the node with the highest bound
+    stats: optional dict, receives "expanded" (nodes whose children were
+           generated) and "pruned" (nodes cut off by the bound)
+    Returns: (best_score, best_solution), or (None, None) if no placement exists
+
+    Bound: score so far + for every remaining row the best score among the
+    cells not attacked by the queens already placed. It never underestimates
+    (admissible), so a node whose bound is not above the incumbent (best
+    complete placement found so far) cannot lead to a better one. A row with
+    no free cell left makes the bound -inf (infeasible).
+    """
+    n = len(scores)
+    best_score = None
+    best_solution = None
+    expanded = pruned = 0
+
+    def bound(row, score, cols, diag1, diag2):
+        total = score
+        for r in range(row, n):
+            free = [scores[r][c] for c in range(n)
+                    if c not in cols and (r - c) not in diag1 and (r + c) not in diag2]
+            if not free:
+                return float('-inf')
+            total += max(free)
+        return total
+
+    def children(row, cols, diag1, diag2):
+        # free columns of this row, best score first
+        free = [c for c in range(n)
+                if c not in cols and (row - c) not in diag1 and (row + c) not in diag2]
+        return sorted(free, key=lambda c: -scores[row][c])
+
+    def better(value):
+        return best_score is None or value > best_score
+
+    if mode == "depth":
+        cols, diag1, diag2 = set(), set(), set()
+        partial = []
+
+        def place(row, score):
+            nonlocal best_score, best_solution, expanded, pruned
+            if row == n:
+                # complete placement: bound == score, so it beats the incumbent
+                best_score = score
+                best_solution = partial.copy()
+                return
+            # Bound: prune if even the optimistic estimate cannot win
+            if not better(bound(row, score, cols, diag1, diag2)):
+                pruned += 1
+                return
+            expanded += 1
+            for c in children(row, cols, diag1, diag2):
+                cols.add(c)
+                diag1.add(row - c)
+                diag2.add(row + c)
+                partial.append(c)
+                place(row + 1, score + scores[row][c])
+                partial.pop()
+                cols.remove(c)
+                diag1.remove(row - c)
+                diag2.remove(row + c)
+
+        place(0, 0)
+
+    elif mode == "best":
+        # heap entries: (-bound, counter, score, partial); sets are rebuilt
+        # from the partial placement when a node is expanded
+        counter = 0
+        heap = [(-bound(0, 0, set(), set(), set()), counter, 0, ())]
+        while heap:
+            neg_bound, _, score, partial = heapq.heappop(heap)
+            if not better(-neg_bound):
+                pruned += 1
+                continue
+            row = len(partial)
+            if row == n:
+                best_score = score
+                best_solution = list(partial)
+                continue
+            expanded += 1
+            cols = set(partial)
+            diag1 = {r - c for r, c in enumerate(partial)}
+            diag2 = {r + c for r, c in enumerate(partial)}
+            for c in children(row, cols, diag1, diag2):
+                child_score = score + scores[row][c]
+                cols.add(c)
+                diag1.add(row - c)
+                diag2.add(row + c)
+                child_bound = bound(row + 1, child_score, cols, diag1, diag2)
+                cols.remove(c)
+                diag1.remove(row - c)
+                diag2.remove(row + c)
+                if not better(child_bound):
+                    pruned += 1
+                    continue
+                counter += 1
+                heapq.heappush(heap, (-child_bound, counter, child_score, partial + (c,)))
+
+    else:
+        raise ValueError(f"unknown mode {mode!r}")
+
+    if stats is not None:
+        stats.update(expanded=expanded, pruned=pruned)
+    return best_score, best_solution
+
+
+def random_scores(n, low=0, high=100, seed=0):
+    """n x n matrix of random integer cell scores."""
+    import random
+    rng = random.Random(seed)
+    return [[rng.randint(low, high) for _ in range(n)] for _ in range(n)]
+
+
+def benchmark(sizes=(6, 8, 10, 12), seed=0):
+    """
+    Nodes and time of exhaustive enumeration (solve_n_queens + max over all
+    solutions) versus depth-first and best-first branch and bound.
+    """
+    import time
+
+    print(f"{'n':>3}{'method':>12}{'best':>7}{'expanded':>10}{'pruned':>9}{'seconds':>10}")
+    for n in sizes:
+        scores = random_scores(n, seed=seed)
+        stats = {}
+        t0 = time.perf_counter()
+        sols = solve_n_queens(n, stats)
+        best = max((sum(scores[r][c] for r, c in enumerate(s)) for s in sols), default=None)
+        elapsed = time.perf_counter() - t0
+        print(f"{n:>3}{'exhaustive':>12}{str(best):>7}{stats['nodes']:>10}{0:>9}{elapsed:>10.4f}")
+        for mode in ("depth", "best"):
+            stats = {}
+            t0 = time.perf_counter()
+            value, _ = solve_weighted_n_queens(scores, mode, stats)
+            elapsed = time.perf_counter() - t0
+            assert value == best
+            print(f"{n:>3}{mode:>12}{str(value):>7}{stats['expanded']:>10}"
+                  f"{stats['pruned']:>9}{elapsed:>10.4f}")
+
+
 # Example usage: print all solutions for n = 4
 if __name__ == "__main__":
     n = 4
@@ -53,3 +207,13 @@ if __name__ == "__main__":
     print(f"Number of solutions for n={n}: {len(sols)}")
     for sol in sols:
         print(sol)
+
+    # Weighted variant: maximize the sum of cell scores
+    scores = random_scores(n)
+    value, placement = solve_weighted_n_queens(scores)
+    print("Best weighted placement:", placement, "score:", value)
+
+    # Run with --bench to compare the bound against exhaustive enumeration
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
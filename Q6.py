@@ -4,8 +4,154 @@ graph coloring problem.'''
 # Very simple Branch-and-Bound graph coloring (minimize colors)
 # Graph is adjacency list: graph[v] -> list of neighbor vertices
 
-def graph_coloring_branch_and_bound(graph):
+import random
+import time
+
+
+class _Budget:
+    """Time / node budget shared by the coloring searches."""
+
+    def __init__(self, time_limit=None, node_limit=None):
+        self.start = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.exhausted = False
+
+    def out_of_time(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            self.exhausted = True
+        return self.exhausted
+
+    def tick(self):
+        """Count one search node; returns True once the budget is used up."""
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            self.exhausted = True
+        elif self.nodes & 255 == 0:
+            self.out_of_time()  # reading the clock every node is too slow
+        return self.exhausted
+
+
+def _compact(colors):
+    """Renumber colors to 0..m-1 in order of first use; returns (m, colors)."""
+    mapping = {}
+    for c in colors:
+        mapping.setdefault(c, len(mapping))
+    return len(mapping), [mapping[c] for c in colors]
+
+
+def tabucol(graph, k, initial=None, max_iters=1000, seed=0, budget=None):
+    """
+    Tabu search for a proper coloring with k colors (TabuCol).
+    Each step moves one conflicting vertex to the color that removes the
+    most conflicts; moving it back to its old color is forbidden (tabu) for
+    a while, unless that would beat the best conflict count seen so far.
+    initial: starting colors (entries >= k are replaced at random)
+    budget: optional _Budget, the search stops when it runs out of time
+    Returns: list of colors without conflicts, or None if none was found
+    """
+    n = len(graph)
+    rng = random.Random(seed)
+    if initial is None:
+        initial = [k] * n
+    color = [c if 0 <= c < k else rng.randrange(k) for c in initial]
+
+    # gamma[v][c] = number of neighbors of v that currently have color c
+    gamma = [[0] * k for _ in range(n)]
+    for v in range(n):
+        for u in graph[v]:
+            gamma[v][color[u]] += 1
+    conflicts = sum(gamma[v][color[v]] for v in range(n)) // 2
+    best_conflicts = conflicts
+    tabu = {}  # (vertex, color) -> last iteration in which the move is tabu
+
+    for it in range(max_iters):
+        if conflicts == 0:
+            return color
+        if it & 63 == 0 and budget is not None and budget.out_of_time():
+            return None
+
+        best_move = None
+        best_delta = None
+        ties = 0
+        for v in range(n):
+            cv = color[v]
+            gv = gamma[v]
+            if gv[cv] == 0:
+                continue  # only conflicting vertices are moved
+            for c in range(k):
+                if c == cv:
+                    continue
+                delta = gv[c] - gv[cv]
+                if tabu.get((v, c), -1) >= it and conflicts + delta >= best_conflicts:
+                    continue  # tabu and no aspiration
+                if best_delta is None or delta < best_delta:
+                    best_move, best_delta, ties = (v, c), delta, 1
+                elif delta == best_delta:
+                    ties += 1
+                    if rng.randrange(ties) == 0:  # pick uniformly among ties
+                        best_move = (v, c)
+        if best_move is None:
+            continue  # every move is tabu this round
+
+        v, c = best_move
+        old = color[v]
+        color[v] = c
+        for u in graph[v]:
+            gamma[u][old] -= 1
+            gamma[u][c] += 1
+        conflicts += best_delta
+        best_conflicts = min(best_conflicts, conflicts)
+        tabu[(v, old)] = it + int(0.6 * conflicts) + rng.randrange(10)
+
+    return color if conflicts == 0 else None
+
+
+def _tabucol_phase(graph, best_colors, best_assignment, lower_bound, tabu_iters, budget, report):
+    """
+    Local-search improvement between the greedy bound and the exact search:
+    keep asking tabucol for a coloring with one color less than the incumbent.
+    Returns: the improved (best_colors, best_assignment)
+    """
+    while tabu_iters and best_colors > lower_bound and not budget.exhausted:
+        colors = tabucol(graph, best_colors - 1, best_assignment, tabu_iters,
+                         seed=best_colors, budget=budget)
+        if colors is None:
+            break
+        best_colors, best_assignment = _compact(colors)
+        report(best_colors, best_assignment)
+    return best_colors, best_assignment
+
+
+def _record_stats(stats, budget, lower_bound, best_colors):
+    if stats is not None:
+        stats.update(lower_bound=lower_bound,
+                     optimal=not budget.exhausted or best_colors == lower_bound,
+                     nodes=budget.nodes,
+                     seconds=time.perf_counter() - budget.start)
+
+
+def graph_coloring_branch_and_bound(graph, time_limit=None, node_limit=None,
+                                    on_improve=None, tabu_iters=1000, stats=None):
+    """
+    Branch-and-bound coloring with a static (descending degree) order.
+    time_limit / node_limit: optional budget in seconds / search nodes;
+        when it runs out the best coloring found so far is returned
+    on_improve: optional callback(colors, assignment), called for the first
+        (greedy) coloring and every time a better one is found
+    tabu_iters: iterations per tabucol attempt between the greedy bound and
+        the exact search (0 = skip the local search)
+    stats: optional dict, receives "lower_bound" (clique size), "optimal"
+        (True if the result is proven minimal), "nodes" and "seconds"
+    Returns: (best_colors, best_assignment)
+    """
     n = len(graph)
+    budget = _Budget(time_limit, node_limit)
+    lower_bound = len(greedy_clique(graph))
+    if n == 0:
+        _record_stats(stats, budget, 0, 0)
+        return 0, []
 
     # 1) quick greedy coloring to get an initial upper bound
     def greedy_order_coloring(order):
@@ -27,6 +173,14 @@ def graph_coloring_branch_and_bound(graph):
     best_colors = ub_used
     best_assignment = ub_assignment.copy()
 
+    def report(colors, assignment):
+        if on_improve is not None:
+            on_improve(colors, assignment.copy())
+
+    report(best_colors, best_assignment)
+    best_colors, best_assignment = _tabucol_phase(
+        graph, best_colors, best_assignment, lower_bound, tabu_iters, budget, report)
+
     # 2) prepare search order and structures
     order = initial_order  # we color vertices in this order
     assignment = [-1] * n
@@ -44,11 +198,14 @@ def graph_coloring_branch_and_bound(graph):
         if used >= best_colors:
             # bound: already used too many colors -> prune
             return
+        if budget.tick():
+            return  # out of time / nodes: keep the incumbent
 
         if idx == n:
             # a full coloring found with 'used' colors -> update best
             best_colors = used
             best_assignment = assignment.copy()
+            report(best_colors, best_assignment)
             return
 
         v = order[idx]
@@ -59,6 +216,8 @@ def graph_coloring_branch_and_bound(graph):
                 assignment[v] = c
                 search(idx + 1, used)
                 assignment[v] = -1
+                if budget.exhausted or best_colors == lower_bound:
+                    return  # stopped, or proven optimal (clique bound reached)
 
         # try a new color 'used' (increase colors by 1) if it can improve best
         if used + 1 < best_colors:
@@ -66,11 +225,213 @@ def graph_coloring_branch_and_bound(graph):
             search(idx + 1, used + 1)
             assignment[v] = -1
 
-    # start search
-    search(0, 0)
+    # start search (unless the clique bound already proves optimality)
+    if best_colors > lower_bound:
+        search(0, 0)
+    _record_stats(stats, budget, lower_bound, best_colors)
+    return best_colors, best_assignment
+
+
+def greedy_clique(graph):
+    """
+    Find a large clique greedily: starting from every vertex, keep adding
+    the highest-degree candidate adjacent to all vertices chosen so far.
+    Its size is a lower bound on the number of colors.
+    Returns: list of vertices forming a clique
+    """
+    n = len(graph)
+    adj = [set(graph[v]) - {v} for v in range(n)]
+    best = []
+    for start in sorted(range(n), key=lambda x: -len(adj[x])):
+        if len(adj[start]) + 1 <= len(best):
+            break  # no clique through this vertex can be larger
+        clique = [start]
+        candidates = set(adj[start])
+        while candidates:
+            v = max(candidates, key=lambda x: (len(adj[x]), -x))
+            clique.append(v)
+            candidates &= adj[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def dsatur_greedy(graph):
+    """
+    Greedy DSATUR coloring: repeatedly color the uncolored vertex with the
+    most distinct neighbor colors (ties: higher degree) with its smallest
+    free color. Usually a much better upper bound than a static order.
+    Returns: (colors_used, color list)
+    """
+    n = len(graph)
+    color = [-1] * n
+    forbidden = [0] * n   # bit c set -> some neighbor already has color c
+    sat = [0] * n
+    for _ in range(n):
+        v = max((u for u in range(n) if color[u] == -1),
+                key=lambda u: (sat[u], len(graph[u])))
+        c = 0
+        while forbidden[v] >> c & 1:
+            c += 1
+        color[v] = c
+        for u in graph[v]:
+            if not forbidden[u] >> c & 1:
+                forbidden[u] |= 1 << c
+                sat[u] += 1
+    return (max(color) + 1 if n else 0), color
+
+
+def graph_coloring_dsatur(graph, time_limit=None, node_limit=None,
+                          on_improve=None, tabu_iters=1000, stats=None):
+    """
+    Exact branch-and-bound coloring with DSATUR branching.
+    - next vertex: the uncolored one with the highest saturation degree
+      (number of distinct colors among its neighbors), ties by degree
+    - forbidden colors of every vertex are kept as a bitmask and updated
+      incrementally when a neighbor is colored / uncolored
+    - lower bound: a greedily found clique, whose vertices are pre-colored
+      0..k-1; the search stops as soon as the incumbent reaches it
+    - upper bound: greedy DSATUR coloring, improved by tabucol
+    Same inputs, budget/callback options and output as
+    graph_coloring_branch_and_bound:
+    Returns: (best_colors, best_assignment)
+    """
+    n = len(graph)
+    budget = _Budget(time_limit, node_limit)
+    if n == 0:
+        _record_stats(stats, budget, 0, 0)
+        return 0, []
+
+    clique = greedy_clique(graph)
+    lower_bound = len(clique)
+    best_colors, best_assignment = dsatur_greedy(graph)
+
+    def report(colors, assignment):
+        if on_improve is not None:
+            on_improve(colors, assignment.copy())
+
+    report(best_colors, best_assignment)
+    best_colors, best_assignment = _tabucol_phase(
+        graph, best_colors, best_assignment, lower_bound, tabu_iters, budget, report)
+    if best_colors == lower_bound:
+        _record_stats(stats, budget, lower_bound, best_colors)
+        return best_colors, best_assignment
+
+    degree = [len(graph[v]) for v in range(n)]
+    assignment = [-1] * n
+    forbidden = [0] * n
+    sat = [0] * n
+
+    def assign(v, c):
+        # color v with c; returns the neighbors whose forbidden mask changed
+        assignment[v] = c
+        bit = 1 << c
+        changed = []
+        for u in graph[v]:
+            if not forbidden[u] & bit:
+                forbidden[u] |= bit
+                sat[u] += 1
+                changed.append(u)
+        return changed
+
+    def unassign(v, c, changed):
+        assignment[v] = -1
+        mask = ~(1 << c)
+        for u in changed:
+            forbidden[u] &= mask
+            sat[u] -= 1
+
+    # the clique needs distinct colors in any coloring, fix them up front
+    for c, v in enumerate(clique):
+        assign(v, c)
+
+    def search(colored, used):
+        nonlocal best_colors, best_assignment
+        if budget.tick():
+            return
+        if colored == n:
+            best_colors = used
+            best_assignment = assignment.copy()
+            report(best_colors, best_assignment)
+            return
+
+        v = max((u for u in range(n) if assignment[u] == -1),
+                key=lambda u: (sat[u], degree[u]))
+        # color c means at least c + 1 colors: only c + 1 < best_colors can improve,
+        # and new colors beyond 'used' are interchangeable, so try just one of them
+        for c in range(min(used + 1, best_colors - 1)):
+            if forbidden[v] >> c & 1:
+                continue
+            changed = assign(v, c)
+            search(colored + 1, max(used, c + 1))
+            unassign(v, c, changed)
+            if budget.exhausted or best_colors == lower_bound:
+                return  # stopped, or proven optimal
+
+    search(len(clique), lower_bound)
+    _record_stats(stats, budget, lower_bound, best_colors)
     return best_colors, best_assignment
 
 
+def random_graph(n, p, seed=0):
+    """G(n, p) random graph as list of lists (DIMACS-style benchmark input)."""
+    import random
+    rng = random.Random(seed)
+    graph = [[] for _ in range(n)]
+    for u in range(n):
+        for v in range(u + 1, n):
+            if rng.random() < p:
+                graph[u].append(v)
+                graph[v].append(u)
+    return graph
+
+
+def parse_dimacs(text):
+    """
+    Read a DIMACS .col graph ("p edge n m" header, "e u v" lines with
+    1-based vertices) into the list-of-lists format used here.
+    """
+    graph = []
+    for line in text.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == "p":
+            graph = [[] for _ in range(int(parts[2]))]
+        elif parts[0] == "e":
+            u, v = int(parts[1]) - 1, int(parts[2]) - 1
+            if v not in graph[u]:
+                graph[u].append(v)
+                graph[v].append(u)
+    return graph
+
+
+def benchmark(cases=((30, 0.5), (40, 0.5), (50, 0.5), (100, 0.1), (200, 0.05)),
+              seed=0, max_static_n=40):
+    """
+    Time the static-order B&B against graph_coloring_dsatur on random
+    G(n, p) graphs given as (n, p) cases (the static search is only run up
+    to max_static_n vertices, it takes minutes at n = 50).
+    """
+    import time
+
+    print(f"{'n':>5}{'p':>6}{'colors':>8}{'static (s)':>12}{'dsatur (s)':>12}")
+    for n, p in cases:
+        graph = random_graph(n, p, seed)
+        if n <= max_static_n:
+            t0 = time.perf_counter()
+            static_colors, _ = graph_coloring_branch_and_bound(graph)
+            static_col = f"{time.perf_counter() - t0:.3f}"
+        else:
+            static_colors, static_col = None, "-"
+        t0 = time.perf_counter()
+        colors, assignment = graph_coloring_dsatur(graph)
+        elapsed = time.perf_counter() - t0
+        assert static_colors in (None, colors)
+        assert all(assignment[u] != assignment[v] for u in range(n) for v in graph[u])
+        print(f"{n:>5}{p:>6}{colors:>8}{static_col:>12}{elapsed:>12.3f}")
+
+
 # ---------- Example usage ----------
 if __name__ == "__main__":
     # Example graph (triangle plus an extra node):
@@ -91,3 +452,19 @@ if __name__ == "__main__":
     colors_used, assignment = graph_coloring_branch_and_bound(adj)
     print("Minimum colors found:", colors_used)
     print("Color per vertex (vertex:color):", list(enumerate(assignment)))
+
+    print("DSATUR branch and bound:", graph_coloring_dsatur(adj))
+
+    # Anytime use: stop after 0.5 s and report every improvement
+    big = random_graph(150, 0.1, seed=0)
+    info = {}
+    colors_used, _ = graph_coloring_dsatur(
+        big, time_limit=0.5, stats=info,
+        on_improve=lambda k, colors: print("  incumbent:", k, "colors"))
+    print("150-vertex graph:", colors_used, "colors, lower bound", info["lower_bound"],
+          "optimal" if info["optimal"] else "not proven optimal")
+
+    # Run with --bench to compare against the static order search
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
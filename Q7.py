@@ -2,15 +2,21 @@
 graph coloring problem.'''
 # Simple backtracking graph coloring (k-coloring decision + finder)
 
-def can_color_with_k(graph, k):
+from Q6 import dsatur_greedy, greedy_clique
+
+def can_color_with_k(graph, k, stats=None):
     """
     Try to color 'graph' with k colors using backtracking.
     graph: adjacency list as list of lists, vertices are 0..n-1
     k: number of colors (colors are 0..k-1)
+    stats: optional dict, receives "assignments" (colors placed) and
+           "backtracks" (dead ends: vertices reached with no safe color
+           at all, where the search has to step back)
     Returns: list of colors if successful, or None if no coloring exists with k colors.
     """
     n = len(graph)
     colors = [-1] * n  # -1 means unassigned
+    assignments = backtracks = 0
 
     def safe(vertex, c):
         """Return True if no neighbor of 'vertex' already has color c."""
@@ -21,22 +27,199 @@ def can_color_with_k(graph, k):
 
     def assign(v):
         """Try to color vertex v and onward. Returns True if success."""
+        nonlocal assignments, backtracks
         if v == n:               # all vertices colored
             return True
+        dead_end = True
         for c in range(k):       # try each color
             if safe(v, c):
+                dead_end = False
                 colors[v] = c
+                assignments += 1
                 if assign(v + 1):  # recurse
                     return True
                 colors[v] = -1     # backtrack
+        if dead_end:
+            backtracks += 1        # every color clashes with a neighbor
         return False
 
-    if assign(0):
+    found = assign(0)
+    if stats is not None:
+        stats.update(assignments=assignments, backtracks=backtracks)
+    if found:
         return colors
     return None
 
 
-def find_smallest_coloring(graph):
+def can_color_with_k_fc(graph, k, clique=None, stats=None):
+    """
+    Same question as can_color_with_k, answered with a smarter backtracking:
+    - forward checking: every vertex keeps a bitmask of colors still allowed
+      (its domain); coloring v removes that color from v's uncolored
+      neighbors, and a neighbor left with no color fails immediately
+    - MRV ordering: always color the vertex with the fewest allowed colors
+      (ties: highest degree) instead of the fixed order 0..n-1
+    - conflict-directed backjumping: every failure returns the set of
+      earlier vertices responsible for it, and the search jumps straight
+      back to the most recent of them instead of the previous vertex
+    clique: optional list of mutually adjacent vertices, pre-colored
+            0, 1, 2, ... (any coloring can be renamed to fit, so this only
+            removes symmetric copies of the same search)
+    stats: optional dict, receives "nodes" and "backjumps"
+    Returns: list of colors if successful, or None
+    """
+    n = len(graph)
+    adj = [[u for u in set(graph[v]) if u != v] for v in range(n)]
+    degree = [len(adj[v]) for v in range(n)]
+    colors = [-1] * n
+    domain = [(1 << k) - 1] * n
+    pruned_by = [[] for _ in range(n)]  # vertices that removed colors from v's domain
+    nodes = backjumps = 0
+
+    def assign(v, c):
+        """Color v and forward check; returns (changed, wiped-out vertex or None)."""
+        colors[v] = c
+        bit = 1 << c
+        changed = []
+        for u in adj[v]:
+            if colors[u] == -1 and domain[u] & bit:
+                domain[u] &= ~bit
+                pruned_by[u].append(v)
+                changed.append(u)
+                if not domain[u]:
+                    return changed, u
+        return changed, None
+
+    def unassign(v, c, changed):
+        colors[v] = -1
+        bit = 1 << c
+        for u in changed:
+            domain[u] |= bit
+            pruned_by[u].pop()
+
+    def select():
+        """MRV: uncolored vertex with the fewest allowed colors, or -1."""
+        v = -1
+        for u in range(n):
+            if colors[u] == -1 and (v < 0 or (bin(domain[u]).count("1"), -degree[u])
+                                    < (bin(domain[v]).count("1"), -degree[v])):
+                v = u
+        return v
+
+    def label():
+        """
+        None on success, otherwise the conflict set of the failure.
+        The search keeps its own stack of frames [vertex, colors not tried
+        yet, conflict set, current color, vertices pruned by it] instead of
+        recursing, so it is not limited by the recursion limit.
+        """
+        nonlocal nodes, backjumps
+        stack = []
+        result = None  # conflict set handed back by the frame just popped
+        descend = True
+        while True:
+            if descend:
+                nodes += 1
+                v = select()
+                if v < 0:
+                    return None  # every vertex is colored
+                stack.append([v, domain[v], set(), -1, None])
+                descend = False
+            frame = stack[-1]
+            v, values, conflict, c, changed = frame
+            if result is not None:
+                # the vertex colored after v failed with this conflict set
+                if v not in result:
+                    # v is not to blame: jump over it
+                    unassign(v, c, changed)
+                    backjumps += 1
+                    stack.pop()
+                    if not stack:
+                        return result
+                    continue
+                conflict.update(result)
+                conflict.discard(v)
+                unassign(v, c, changed)
+                result = None
+
+            while values:
+                bit = values & -values
+                values ^= bit
+                c = bit.bit_length() - 1
+                changed, wiped = assign(v, c)
+                if wiped is None:
+                    frame[1], frame[3], frame[4] = values, c, changed
+                    descend = True
+                    break
+                # the wiped-out neighbor failed because of everyone who pruned it
+                conflict.update(pruned_by[wiped])
+                conflict.discard(v)
+                unassign(v, c, changed)
+            if descend:
+                continue
+            # the colors missing from v's domain were removed by these vertices
+            conflict.update(pruned_by[v])
+            stack.pop()
+            if not stack:
+                return conflict
+            result = conflict
+
+    if k <= 0:
+        result = None if n else []
+    elif clique and len(clique) > k:
+        result = None
+    else:
+        ok = True
+        for c, v in enumerate(clique or []):
+            if assign(v, c)[1] is not None:
+                ok = False
+                break
+        result = colors if ok and label() is None else None
+
+    if stats is not None:
+        stats.update(nodes=nodes, backjumps=backjumps)
+    return result
+
+
+def find_smallest_coloring(graph, strategy="down"):
+    """
+    Smallest k for which can_color_with_k_fc succeeds, and that coloring.
+    Instead of trying k = 1..n from scratch, k is searched between
+    - a lower bound: size of a greedily found clique (needs that many colors)
+    - an upper bound: a greedy DSATUR coloring (already a valid coloring)
+    strategy: "down"   -> try k = best - 1 until it fails: only the last,
+                          expensive k is ever a failing call
+              "bisect" -> binary search between the bounds
+    Returns: (k, colors), or (None, None) for an empty graph
+    """
+    n = len(graph)
+    if n == 0:
+        return None, None
+
+    clique = greedy_clique(graph)
+    low = len(clique)
+    best_k, best = dsatur_greedy(graph)
+
+    if strategy == "down":
+        while best_k > low:
+            result = can_color_with_k_fc(graph, best_k - 1, clique)
+            if result is None:
+                break
+            best_k, best = max(result) + 1, result
+    elif strategy == "bisect":
+        while low < best_k:
+            mid = (low + best_k) // 2
+            result = can_color_with_k_fc(graph, mid, clique)
+            if result is None:
+                low = mid + 1
+            else:
+                best_k, best = max(result) + 1, result
+    else:
+        raise ValueError(f"unknown strategy {strategy!r}")
+    return best_k, best
+
+
+def find_smallest_coloring_naive(graph):
     """
     Naively try k = 1..n and return the first successful coloring and k.
     This gives a valid coloring with the smallest k found by brute force.
@@ -49,6 +232,35 @@ def find_smallest_coloring(graph):
     return None, None
 
 
+def benchmark(cases=((15, 0.5), (20, 0.5), (30, 0.5), (40, 0.5), (100, 0.1)),
+              seed=0, max_naive_n=20):
+    """
+    Total time per graph of the k = 1..n loop (find_smallest_coloring_naive,
+    only up to max_naive_n vertices) against find_smallest_coloring.
+    """
+    import time
+    from Q6 import random_graph
+
+    print(f"{'n':>5}{'p':>6}{'k':>4}{'naive (s)':>11}{'down (s)':>10}{'bisect (s)':>12}")
+    for n, p in cases:
+        graph = random_graph(n, p, seed)
+        row = f"{n:>5}{p:>6}"
+        if n <= max_naive_n:
+            t0 = time.perf_counter()
+            naive_k, _ = find_smallest_coloring_naive(graph)
+            naive = f"{time.perf_counter() - t0:.3f}"
+        else:
+            naive_k, naive = None, "-"
+        times = []
+        for strategy in ("down", "bisect"):
+            t0 = time.perf_counter()
+            k, colors = find_smallest_coloring(graph, strategy)
+            times.append(time.perf_counter() - t0)
+            assert naive_k in (None, k)
+            assert all(colors[u] != colors[v] for u in range(n) for v in graph[u])
+        print(f"{row}{k:>4}{naive:>11}{times[0]:>10.3f}{times[1]:>12.3f}")
+
+
 # Example usage
 if __name__ == "__main__":
     # Example 1: triangle (3 vertices all connected) -> needs 3 colors
@@ -69,3 +281,8 @@ if __name__ == "__main__":
     ]
     k2, coloring2 = find_smallest_coloring(square)
     print("Square -> smallest k:", k2, "coloring:", coloring2)
+
+    # Run with --bench to compare against the k = 1..n loop
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
@@ -4,9 +4,20 @@
 # Graph is given as a list of edges: (u, v, weight)
 # Vertices can be integers or any hashable objects.
 
-def kruskal(edges):
+from array import array
+from collections import defaultdict
+from itertools import count
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # optional: only used to sort the weights faster
+    np = None
+
+def kruskal(edges, stats=None):
     """
     edges: list of tuples (u, v, w)
+    stats: optional dict, receives "edges_scanned" and "unions"
     returns: (mst_edges, total_cost)
       mst_edges: list of (u, v, w) that form the MST
       total_cost: sum of weights in the MST
@@ -51,8 +62,10 @@ def kruskal(edges):
     # 4. Kruskal main loop
     mst_edges = []
     total_cost = 0
+    scanned = 0
 
     for u, v, w in edges_sorted:
+        scanned += 1
         if union(u, v):           # if u and v were in different components
             mst_edges.append((u, v, w))
             total_cost += w
@@ -61,9 +74,394 @@ def kruskal(edges):
         if len(mst_edges) == len(verts) - 1:
             break
 
+    if stats is not None:
+        stats.update(edges_scanned=scanned, unions=len(mst_edges))
     return mst_edges, total_cost
 
 
+# ---------- Fast path: dense ids + typed arrays ----------
+# kruskal above keeps a dict entry per vertex and sorts a list of tuples.
+# Here vertices are interned to ids 0..n-1 once, the edges live in three
+# parallel arrays and the union-find in two typed arrays, so the main loop
+# only touches small ints. Without NumPy the weights are radix sorted into
+# an array('q') of edge indices: sorted(range(m), key=...) would box every
+# index and every key and more than double the peak memory.
+
+def _radix_argsort(keys, lo, hi):
+    """
+    Stable LSD radix sort of the indices of keys (ints in lo..hi), into an
+    array('q'). Each pass handles one digit of the key: count the digits,
+    turn the counts into start positions, then move every index to its slot.
+    """
+    m = len(keys)
+    span_bits = (hi - lo).bit_length()
+    if span_bits == 0:
+        return array('q', range(m))  # all keys equal
+    passes = -(-span_bits // 16)  # digits of at most 16 bits
+    bits = -(-span_bits // passes)
+    mask = (1 << bits) - 1
+    order = spare = None  # first pass reads the indices in input order
+    for shift in range(0, span_bits, bits):
+        counts = [0] * (mask + 1)
+        for k in keys:
+            counts[((k - lo) >> shift) & mask] += 1
+        start = 0
+        for d, c in enumerate(counts):
+            counts[d] = start
+            start += c
+        placed = spare if spare is not None else array('q', bytes(8 * m))
+        if order is None:
+            for i, k in enumerate(keys):
+                d = ((k - lo) >> shift) & mask
+                placed[counts[d]] = i
+                counts[d] += 1
+        else:
+            for i in order:
+                d = ((keys[i] - lo) >> shift) & mask
+                placed[counts[d]] = i
+                counts[d] += 1
+        order, spare = placed, order
+    return order
+
+
+def argsort_weights(ws):
+    """
+    Edge indices sorted by weight, equal weights in input order, as an
+    array('q') (8 bytes per edge, no boxed index per edge).
+    All-int weights are radix sorted directly; all-float weights are radix
+    sorted on their IEEE-754 bit patterns, mapped to ints of the same order.
+    Other weights (Fraction, Decimal, mixed types) use sorted().
+    """
+    if not len(ws):
+        return array('q')
+    if isinstance(ws, array) and ws.typecode in "bBhHiIlLqQ" or all(type(w) is int for w in ws):
+        return _radix_argsort(ws, min(ws), max(ws))
+    if isinstance(ws, array) and ws.typecode in "fd" or all(type(w) is float for w in ws):
+        keys = array('q')
+        keys.frombytes(array('d', ws).tobytes())  # same 8 bytes, read as int
+        for i, k in enumerate(keys):
+            if k < 0:
+                # negative floats: sign bit set, and a larger magnitude must
+                # come first; -0.0 becomes the key of 0.0
+                keys[i] = k ^ 0x7FFFFFFFFFFFFFFF if k != -1 << 63 else 0
+        return _radix_argsort(keys, min(keys), max(keys))
+    return array('q', sorted(range(len(ws)), key=ws.__getitem__))
+
+
+def kruskal_arrays(us, vs, ws, num_vertices=None):
+    """
+    Kruskal over parallel arrays: edge i joins vertex ids us[i] and vs[i]
+    (ints 0..n-1) with weight ws[i]. NumPy arrays, array.array or lists.
+    Edges of equal weight are taken in input order (stable sort), so the
+    result is the same tree kruskal() picks.
+    num_vertices: n (default: largest id + 1)
+    Returns: (indices of the MST edges in order of acceptance, total_cost)
+    """
+    if np is not None:
+        order = np.argsort(np.asarray(ws), kind="stable").tolist()
+    else:
+        order = argsort_weights(ws)
+    if np is not None and isinstance(us, np.ndarray):
+        # scalar indexing of NumPy arrays is slow in a Python loop
+        us, vs, ws = us.tolist(), vs.tolist(), ws.tolist()
+    if num_vertices is None:
+        num_vertices = max(max(us, default=-1), max(vs, default=-1)) + 1
+
+    parent = array('q', range(num_vertices))
+    rank = bytearray(num_vertices)
+    mst = array('q')
+    total_cost = 0
+    remaining = num_vertices - 1
+    for i in order:
+        a = us[i]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]  # path halving
+            a = parent[a]
+        b = vs[i]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        if rank[a] < rank[b]:
+            parent[a] = b
+        elif rank[b] < rank[a]:
+            parent[b] = a
+        else:
+            parent[b] = a
+            rank[a] += 1
+        mst.append(i)
+        total_cost += ws[i]
+        remaining -= 1
+        if not remaining:
+            break  # spanning tree complete
+    return mst, total_cost
+
+
+def intern_edges(edges):
+    """
+    Turn (u, v, w) tuples into (labels, us, vs, ws): vertex labels by id and
+    parallel arrays of ids and weights (ws stays a list, so int weights
+    keep an exact int total).
+    Labels that already are ints 0..n-1 (n at most 2 * len(edges) + 1) are
+    used as ids directly and labels is range(n); anything else is mapped
+    to ids in order of first appearance. Either way the loops run in C
+    (map / array), not per edge in Python.
+    """
+    if not isinstance(edges, (list, tuple)):
+        edges = list(edges)
+    ws = list(map(itemgetter(2), edges))
+    try:
+        us = array('q', map(itemgetter(0), edges))
+        vs = array('q', map(itemgetter(1), edges))
+    except (TypeError, OverflowError):
+        pass  # not all labels are ints
+    else:
+        n = max(max(us, default=-1), max(vs, default=-1)) + 1
+        if min(us, default=0) >= 0 and min(vs, default=0) >= 0 and n <= 2 * len(edges) + 1:
+            return range(n), us, vs, ws
+    index = defaultdict(count().__next__)  # label -> id, new ids on first lookup
+    us = array('q', map(index.__getitem__, map(itemgetter(0), edges)))
+    vs = array('q', map(index.__getitem__, map(itemgetter(1), edges)))
+    return list(index), us, vs, ws
+
+
+def kruskal_fast(edges):
+    """
+    Same input and output as kruskal(edges), using kruskal_arrays. The
+    arrays are built next to the tuples, so this is faster than kruskal but
+    peaks a bit higher in memory; the memory saving needs the edges kept as
+    arrays from the start (kruskal_arrays).
+    """
+    labels, us, vs, ws = intern_edges(edges)
+    mst, total_cost = kruskal_arrays(us, vs, ws, len(labels))
+    return [(labels[us[i]], labels[vs[i]], ws[i]) for i in mst], total_cost
+
+
+# ---------- Streaming / external-memory Kruskal ----------
+# For edge lists larger than memory: edges are read chunk_size at a time,
+# each chunk is sorted and spilled to a temporary file (a sorted run), and
+# the runs are k-way merged with heapq.merge. Only one block per run, the
+# merge heap and the union-find are in memory at any time.
+
+def _parse_edge(line):
+    """'u v w' -> (u, v, w); int vertex ids, int or float weight."""
+    u, v, w = line.split()[:3]
+    try:
+        w = int(w)
+    except ValueError:
+        w = float(w)
+    return int(u), int(v), w
+
+
+def _read_edges(source):
+    """Edges from a path to a 'u v w' text file or from an iterable of tuples."""
+    import os
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as f:
+            for line in f:
+                if line.strip() and not line.lstrip().startswith("#"):
+                    yield _parse_edge(line)
+    else:
+        yield from source
+
+
+def _write_run(records, directory, block_size=4096):
+    """Sort records and pickle them to a new file in blocks; returns the path."""
+    import os
+    import pickle
+    import tempfile
+    records.sort()
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        for start in range(0, len(records), block_size):
+            pickle.dump(records[start:start + block_size], f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    import pickle
+    with open(path, "rb") as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def kruskal_stream(source, chunk_size=1000000, tmpdir=None):
+    """
+    Streaming Kruskal: yields MST edges (u, v, w) one by one in increasing
+    weight order, without holding the edge list in memory.
+    source: path of a text file with one 'u v w' edge per line (integer
+            vertex ids, '#' comments allowed) or any iterable of (u, v, w)
+    chunk_size: edges sorted in memory at a time; every full chunk becomes
+                one sorted run on disk
+    tmpdir: directory for the runs (default: the system temp directory);
+            the runs are deleted when the generator finishes or is closed
+    Ties are broken by input position, so the tree is the one kruskal() picks.
+    Stops as soon as |V| - 1 edges are accepted.
+    """
+    import heapq
+    import tempfile
+
+    parent = {}
+    rank = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        # 1) spill sorted runs; records are (w, seq, u, v) so ties follow input order
+        runs = []
+        chunk = []
+        for seq, (u, v, w) in enumerate(_read_edges(source)):
+            for x in (u, v):
+                if x not in parent:
+                    parent[x] = x
+                    rank[x] = 0
+            chunk.append((w, seq, u, v))
+            if len(chunk) >= chunk_size:
+                runs.append(_write_run(chunk, directory))
+                chunk = []
+        if runs and chunk:
+            runs.append(_write_run(chunk, directory))
+            chunk = []
+        chunk.sort()  # everything fit in one chunk: no files needed
+
+        # 2) merge the runs and run the usual Kruskal loop
+        merged = heapq.merge(*map(_read_run, runs)) if runs else iter(chunk)
+        remaining = len(parent) - 1
+        for w, _, u, v in merged:
+            if remaining <= 0:
+                break
+            ru = find(u)
+            rv = find(v)
+            if ru == rv:
+                continue
+            if rank[ru] < rank[rv]:
+                ru, rv = rv, ru
+            parent[rv] = ru
+            if rank[ru] == rank[rv]:
+                rank[ru] += 1
+            remaining -= 1
+            yield u, v, w
+
+
+def write_edge_file(path, n, m, seed=0, max_weight=1000):
+    """Write m random edges over vertices 0..n-1 as 'u v w' lines."""
+    import random
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        for v in range(1, min(n, m + 1)):
+            f.write(f"{v - 1} {v} {rng.randint(1, max_weight)}\n")
+        for _ in range(m - (n - 1)):
+            f.write(f"{rng.randrange(n)} {rng.randrange(n)} {rng.randint(1, max_weight)}\n")
+
+
+def verify_stream(n=50000, m=500000, chunk_size=60000, seed=0):
+    """
+    Self-check: write a synthetic edge file, stream it through
+    kruskal_stream with several spilled runs, and compare with kruskal on
+    the same edges (identical tree, same total cost).
+    """
+    import os
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.txt")
+        write_edge_file(path, n, m, seed)
+        edges = list(_read_edges(path))
+        print(f"edge file: {n} vertices, {m} edges, {os.path.getsize(path) / 2 ** 20:.1f} MB")
+
+        t0 = time.perf_counter()
+        expected, expected_cost = kruskal(edges)
+        print(f"kruskal:        {time.perf_counter() - t0:.3f} s, cost {expected_cost}")
+
+        t0 = time.perf_counter()
+        streamed = list(kruskal_stream(path, chunk_size=chunk_size, tmpdir=directory))
+        cost = sum(w for _, _, w in streamed)
+        print(f"kruskal_stream: {time.perf_counter() - t0:.3f} s, cost {cost}, "
+              f"{-(-m // chunk_size)} runs")
+        assert streamed == expected and cost == expected_cost
+        assert os.listdir(directory) == ["edges.txt"]  # runs cleaned up
+
+        # iterator source, single in-memory chunk
+        assert list(kruskal_stream(iter(edges), chunk_size=m)) == expected
+    print("streaming MST matches kruskal")
+
+
+# ---------- Benchmark ----------
+
+def random_edges(n, m, seed=0, max_weight=1000):
+    """m random (u, v, w) edges over vertices 0..n-1 (a path keeps it connected)."""
+    import random
+    rng = random.Random(seed)
+    edges = [(v - 1, v, rng.randint(1, max_weight)) for v in range(1, n)]
+    for _ in range(m - len(edges)):
+        edges.append((rng.randrange(n), rng.randrange(n), rng.randint(1, max_weight)))
+    return edges
+
+
+def benchmark(sizes=((10000, 100000), (100000, 1000000)), seed=0, repeat=3):
+    """
+    Best time over `repeat` runs and peak memory of kruskal, kruskal_fast
+    and kruskal_arrays (on prepared arrays), each also relative to kruskal,
+    plus the memory the two input formats take.
+    Memory is measured with tracemalloc in a separate run, since tracing
+    every allocation distorts the timings.
+    """
+    import time
+    import tracemalloc
+
+    def traced(func):
+        tracemalloc.start()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, peak / 2 ** 20
+
+    def timed(func):
+        best = None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
+
+    print(f"numpy: {'yes' if np is not None else 'no'}")
+    print(f"{'n':>8}{'m':>9}  {'version':<16}{'input MB':>9}{'time (s)':>10}{'peak MB':>9}"
+          f"{'time x':>8}{'peak x':>8}")
+    for n, m in sizes:
+        edges, tuples_mb = traced(lambda: random_edges(n, m, seed))
+
+        def as_arrays():
+            _, us, vs, ws = intern_edges(edges)
+            if np is not None:
+                return np.array(us), np.array(vs), np.array(ws)
+            return us, vs, array('q', ws)
+        (us, vs, ws), arrays_mb = traced(as_arrays)
+
+        expected = base = None
+        for name, input_mb, func in (
+                ("kruskal", tuples_mb, lambda: kruskal(edges)),
+                ("kruskal_fast", tuples_mb, lambda: kruskal_fast(edges)),
+                ("kruskal_arrays", arrays_mb, lambda: kruskal_arrays(us, vs, ws))):
+            (_, cost), elapsed = timed(func)
+            _, peak = traced(func)
+            assert expected in (None, cost)
+            expected = cost
+            base = base or (elapsed, peak)  # kruskal's figures
+            print(f"{n:>8}{m:>9}  {name:<16}{input_mb:>9.1f}{elapsed:>10.3f}{peak:>9.1f}"
+                  f"{elapsed / base[0]:>8.2f}{peak / base[1]:>8.2f}")
+
+
 # ---------- Example usage ----------
 if __name__ == "__main__":
     # Example undirected weighted graph as edge list
@@ -90,3 +488,12 @@ if __name__ == "__main__":
     for u, v, w in mst:
         print(f"  {u} -- {v}  (weight {w})")
     print("Total MST cost:", cost)
+    print("Fast path:", kruskal_fast(example_edges) == (mst, cost))
+
+    print("Streaming:", list(kruskal_stream(example_edges, chunk_size=4)) == mst)
+
+    import sys
+    if "--check" in sys.argv:
+        verify_stream()
+    if "--bench" in sys.argv:
+        benchmark()
@@ -1,35 +1,197 @@
 '''Develop an elementary chatbot for any suitable customer interaction application.'''
 # Simple Customer Chatbot
+# The intents live in a table instead of an if/elif chain. IntentMatcher
+# compiles the table once into a keyword -> intent lookup and then reads
+# every message in a single pass, matching whole words only: "hi" no longer
+# fires inside "this", nor "time" inside "sometimes".
+
+import re
+
+# (intent name, keywords, response). When several intents match, the
+# earliest row wins -- the same priority as the old if/elif order.
+# Keywords are whole words or phrases of several words.
+INTENTS = [
+    ("greeting", ("hi", "hello"),
+     "Hello there! How can I help you today?"),
+    ("price", ("price", "prices", "cost", "costs"),
+     "Our prices vary by product. Could you tell me which item you’re interested in?"),
+    ("order", ("order", "orders", "ordered"),
+     "You can place an order on our website, or I can help you track an existing one."),
+    ("hours", ("hours", "hour", "time", "times", "opening hours", "opening times",
+               "are you open", "do you open"),
+     "We’re open Monday to Friday, from 9 AM to 6 PM."),
+    ("return", ("return", "returns", "returned"),
+     "You can return products within 30 days with your receipt."),
+    ("bye", ("bye", "goodbye"),
+     "Goodbye! Have a nice day!"),
+]
+FALLBACK = "I’m sorry, I didn’t understand that. Could you please rephrase?"
+
+WORD = re.compile(r"[a-z0-9']+")
+
+
+class IntentMatcher:
+    """
+    Keyword table compiled for fast lookup.
+    words:   single-word keyword -> priority (row number) of its best intent
+    phrases: first word of a multi-word keyword -> [(words, priority), ...]
+    """
+
+    def __init__(self, intents=INTENTS, fallback=FALLBACK):
+        self.intents = list(intents)
+        self.fallback = fallback
+        self.words = {}
+        self.phrases = {}
+        for priority, (_, keywords, _) in enumerate(self.intents):
+            for keyword in keywords:
+                words = tuple(WORD.findall(keyword.lower()))
+                if len(words) == 1:
+                    self.words.setdefault(words[0], priority)  # first row wins
+                elif words:
+                    self.phrases.setdefault(words[0], []).append((words, priority))
+
+    def match(self, message):
+        """Row number of the matching intent (earliest row wins), or None."""
+        words = WORD.findall(message.lower())
+        best = None
+        for i, word in enumerate(words):
+            priority = self.words.get(word)
+            if priority is not None and (best is None or priority < best):
+                best = priority
+            for phrase, priority in self.phrases.get(word, ()):
+                if (best is None or priority < best) and tuple(words[i:i + len(phrase)]) == phrase:
+                    best = priority
+            if best == 0:
+                break  # nothing can beat the first row
+        return best
+
+    def intent(self, message):
+        """Name of the matching intent, or None."""
+        row = self.match(message)
+        return None if row is None else self.intents[row][0]
+
+    def response(self, message):
+        row = self.match(message)
+        return self.fallback if row is None else self.intents[row][2]
+
+    def classify(self, messages):
+        """Intent names (None = no match) for a batch of messages."""
+        intents = self.intents
+        result = []
+        for message in messages:
+            row = self.match(message)
+            result.append(None if row is None else intents[row][0])
+        return result
+
+
+MATCHER = IntentMatcher()
+
+
+def classify(messages, matcher=MATCHER):
+    """Batch classification with the default intent table."""
+    return matcher.classify(messages)
+
+
+def respond(message, state=None, matcher=MATCHER):
+    """
+    One chatbot turn, without any input/output (used by chatbot() and by
+    chat_server.py). Does not modify `state`.
+    state: dict returned by the previous turn, or None for a new session
+    Returns: (reply, new_state); new_state has "turns", "last_intent" and
+             "done" (True once the user said bye)
+    """
+    row = matcher.match(message)
+    intent = None if row is None else matcher.intents[row][0]
+    state = dict(state or {})
+    state["turns"] = state.get("turns", 0) + 1
+    state["last_intent"] = intent
+    state["done"] = intent == "bye"
+    reply = matcher.fallback if row is None else matcher.intents[row][2]
+    return reply, state
+
 
 def chatbot():
     print("Chatbot: Hello! Welcome to ABC Store.")
     print("Chatbot: How can I help you today?")
     print("Type 'bye' to exit the chat.\n")
 
+    state = None
     while True:
-        user_input = input("You: ").lower()  # convert to lowercase for easy checking
+        reply, state = respond(input("You: "), state)
+        print("Chatbot:", reply)
+        if state["done"]:
+            break  # stop the loop and end the program
 
-        if "hi" in user_input or "hello" in user_input:
-            print("Chatbot: Hello there! How can I help you today?")
 
-        elif "price" in user_input or "cost" in user_input:
-            print("Chatbot: Our prices vary by product. Could you tell me which item you’re interested in?")
+# ---------- Benchmark ----------
 
-        elif "order" in user_input:
-            print("Chatbot: You can place an order on our website, or I can help you track an existing one.")
+def substring_match(intents, message):
+    """The old if/elif chain over a table: one substring scan per keyword."""
+    message = message.lower()
+    for row, (_, keywords, _) in enumerate(intents):
+        for keyword in keywords:
+            if keyword in message:
+                return row
+    return None
 
-        elif "hours" in user_input or "time" in user_input:
-            print("Chatbot: We’re open Monday to Friday, from 9 AM to 6 PM.")
 
-        elif "return" in user_input:
-            print("Chatbot: You can return products within 30 days with your receipt.")
+def random_intents(num_intents, keywords_per_intent=3, seed=0):
+    """Synthetic intent table with distinct random keywords."""
+    import random
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    seen = set()
+    intents = []
+    for i in range(num_intents):
+        keywords = []
+        while len(keywords) < keywords_per_intent:
+            word = "".join(rng.choice(letters) for _ in range(rng.randint(5, 9)))
+            if word not in seen:
+                seen.add(word)
+                keywords.append(word)
+        intents.append((f"intent{i}", tuple(keywords), f"response {i}"))
+    return intents
 
-        elif "bye" in user_input:
-            print("Chatbot: Goodbye! Have a nice day!")
-            break  # stop the loop and end the program
 
-        else:
-            print("Chatbot: I’m sorry, I didn’t understand that. Could you please rephrase?")
+def benchmark(sizes=(6, 100, 1000, 5000), num_messages=2000, seed=0):
+    """
+    Messages/sec of the substring chain against IntentMatcher.classify, and
+    how many messages the chain routes differently (substring hits: with
+    many random keywords some contain others).
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    filler = "please can you tell me about my the a with for this".split()
+    print(f"{'intents':>8}{'chain msg/s':>14}{'matcher msg/s':>15}{'compile (ms)':>14}"
+          f"{'differ':>8}")
+    for size in sizes:
+        intents = INTENTS if size == len(INTENTS) else random_intents(size, seed=seed)
+        keywords = [k for _, ks, _ in intents for k in ks]
+        messages = [" ".join(rng.sample(filler, 6) + [rng.choice(keywords)])
+                    for _ in range(num_messages)]
+
+        t0 = time.perf_counter()
+        matcher = IntentMatcher(intents)
+        compile_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        chain = [substring_match(intents, m) for m in messages]
+        chain_rate = num_messages / (time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        names = matcher.classify(messages)
+        matcher_rate = num_messages / (time.perf_counter() - t0)
+        differ = sum(name != (None if r is None else intents[r][0])
+                     for name, r in zip(names, chain))
+        print(f"{size:>8}{chain_rate:>14.0f}{matcher_rate:>15.0f}{compile_time * 1000:>14.2f}"
+              f"{differ:>8}")
+
 
-# Run the chatbot
-chatbot()
+# Run the chatbot (python Q9.py --bench for the matcher benchmark)
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        chatbot()
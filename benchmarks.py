@@ -0,0 +1,336 @@
+'''Benchmark and profiling harness for the algorithm modules (Q1-Q8).'''
+# Every case builds its input from a seeded generator (not timed) and then
+# runs one algorithm, reporting
+#   seconds:  best wall time over --repeat runs
+#   peak_kb:  peak traced memory of one extra run (tracemalloc; a separate
+#             run, since tracing slows the code down)
+#   counters: algorithm counters (nodes expanded, backtracks, unions, ...),
+#             which should only change when the algorithm itself changes
+# Results can be written as JSON and compared with a stored baseline:
+#   python benchmarks.py --json baseline.json
+#   python benchmarks.py --baseline baseline.json     (exit code 1 on regressions)
+#   python benchmarks.py --only a_star_heap --profile (cProfile top functions)
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+
+# ---------- Seeded input generators ----------
+
+def random_graph(n, avg_degree=4, seed=0):
+    """Random undirected graph (dict of lists), see Q1.random_graph."""
+    from Q1 import random_graph
+    return random_graph(n, avg_degree, seed)
+
+
+def scale_free_graph(n, m=3, seed=0):
+    """
+    Barabasi-Albert graph (dict of lists): every new vertex attaches to m
+    existing vertices chosen proportionally to their degree, which gives a
+    few hubs and many low-degree vertices.
+    """
+    import random
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    targets = list(range(min(m, n)))
+    ends = []  # every vertex appears here once per incident edge
+    for v in range(len(targets), n):
+        for u in set(targets):
+            graph[u].append(v)
+            graph[v].append(u)
+            ends.extend((u, v))
+        targets = [rng.choice(ends) for _ in range(m)]
+    return graph
+
+
+def obstacle_grid(size, density=0.25, seed=0):
+    """Square grid with random obstacles and free corners, see Q3.random_grid."""
+    from Q3 import random_grid
+    return random_grid(size, size, density, seed)
+
+
+def coloring_graph(n, p, seed=0):
+    """G(n, p) as list of lists, see Q6.random_graph."""
+    from Q6 import random_graph
+    return random_graph(n, p, seed)
+
+
+def weighted_edges(n, m, seed=0):
+    """m random (u, v, w) edges over n vertices, see Q8.random_edges."""
+    from Q8 import random_edges
+    return random_edges(n, m, seed)
+
+
+# ---------- Cases ----------
+# Each case is setup(seed) -> run(counters): setup builds the input, run
+# executes the algorithm once and fills the counters dict.
+
+def _dfs_recursive(seed):
+    from Q1 import dfs_recursive
+    graph = random_graph(800, 4, seed)  # the dict path recurses once per vertex
+
+    def run(counters):
+        counters["visited"] = len(dfs_recursive(graph, 0))
+    return run
+
+
+def _dfs_csr_scale_free(seed):
+    from csr import CSRGraph
+    from Q1 import dfs_all_components
+    graph = CSRGraph.from_adjacency(scale_free_graph(50000, 3, seed))
+
+    def run(counters):
+        counters["visited"] = sum(1 for _ in dfs_all_components(graph))
+    return run
+
+
+def _bfs_recursive_full(seed):
+    from Q2 import bfs_recursive_full
+    graph = random_graph(3000, 4, seed)
+
+    def run(counters):
+        counters["visited"] = len(bfs_recursive_full(graph))
+    return run
+
+
+def _bfs_csr_scale_free(seed):
+    from csr import CSRGraph
+    from Q2 import bfs_recursive_full
+    graph = CSRGraph.from_adjacency(scale_free_graph(50000, 3, seed))
+
+    def run(counters):
+        counters["visited"] = len(bfs_recursive_full(graph))
+    return run
+
+
+def _a_star(mode, size):
+    def setup(seed):
+        from Q3 import a_star
+        grid = obstacle_grid(size, 0.25, seed)
+
+        def run(counters):
+            path = a_star(grid, (0, 0), (size - 1, size - 1), mode=mode, stats=counters)
+            counters["path_length"] = None if path is None else len(path)
+            counters.pop("seconds", None)
+        return run
+    return setup
+
+
+def _jump_point_search(seed):
+    from Q3 import jump_point_search
+    grid = obstacle_grid(200, 0.25, seed)
+
+    def run(counters):
+        path = jump_point_search(grid, (0, 0), (199, 199), stats=counters)
+        counters["path_length"] = None if path is None else len(path)
+        counters.pop("seconds", None)
+        counters.pop("cost", None)
+    return run
+
+
+def _solve_n_queens(seed):
+    from Q4 import solve_n_queens
+
+    def run(counters):
+        counters["solutions"] = len(solve_n_queens(9, stats=counters))
+    return run
+
+
+def _count_n_queens(seed):
+    from nqueens import count_n_queens
+
+    def run(counters):
+        counters["solutions"] = count_n_queens(12)
+    return run
+
+
+def _graph_coloring_branch_and_bound(seed):
+    from Q6 import graph_coloring_branch_and_bound
+    graph = coloring_graph(30, 0.5, seed)
+
+    def run(counters):
+        colors, _ = graph_coloring_branch_and_bound(graph, stats=counters)
+        counters["colors"] = colors
+        counters.pop("seconds", None)
+    return run
+
+
+def _graph_coloring_dsatur(seed):
+    from Q6 import graph_coloring_dsatur
+    graph = coloring_graph(60, 0.3, seed)
+
+    def run(counters):
+        colors, _ = graph_coloring_dsatur(graph, stats=counters)
+        counters["colors"] = colors
+        counters.pop("seconds", None)
+    return run
+
+
+def _can_color_with_k(seed):
+    from Q7 import can_color_with_k, find_smallest_coloring
+    graph = coloring_graph(18, 0.5, seed)
+    k, _ = find_smallest_coloring(graph)
+
+    def run(counters):
+        # the failing k - 1 call is the expensive one
+        counters["colorable"] = can_color_with_k(graph, k - 1, stats=counters) is not None
+    return run
+
+
+def _find_smallest_coloring(seed):
+    from Q7 import find_smallest_coloring
+    graph = coloring_graph(40, 0.5, seed)
+
+    def run(counters):
+        counters["colors"], _ = find_smallest_coloring(graph)
+    return run
+
+
+def _kruskal(seed):
+    from Q8 import kruskal
+    edges = weighted_edges(20000, 200000, seed)
+
+    def run(counters):
+        _, counters["total_cost"] = kruskal(edges, stats=counters)
+    return run
+
+
+def _kruskal_arrays(seed):
+    from Q8 import intern_edges, kruskal_arrays
+    _, us, vs, ws = intern_edges(weighted_edges(20000, 200000, seed))
+
+    def run(counters):
+        mst, counters["total_cost"] = kruskal_arrays(us, vs, ws)
+        counters["unions"] = len(mst)
+    return run
+
+
+CASES = {
+    "dfs_recursive": _dfs_recursive,
+    "dfs_csr_scale_free": _dfs_csr_scale_free,
+    "bfs_recursive_full": _bfs_recursive_full,
+    "bfs_csr_scale_free": _bfs_csr_scale_free,
+    "a_star_list": _a_star("list", 60),
+    "a_star_heap": _a_star("heap", 200),
+    "jump_point_search": _jump_point_search,
+    "solve_n_queens": _solve_n_queens,
+    "count_n_queens": _count_n_queens,
+    "graph_coloring_branch_and_bound": _graph_coloring_branch_and_bound,
+    "graph_coloring_dsatur": _graph_coloring_dsatur,
+    "can_color_with_k": _can_color_with_k,
+    "find_smallest_coloring": _find_smallest_coloring,
+    "kruskal": _kruskal,
+    "kruskal_arrays": _kruskal_arrays,
+}
+
+
+# ---------- Running and comparing ----------
+
+def run_case(name, seed=0, repeat=3, profile=False, profile_lines=15):
+    """
+    Run one case: best time over `repeat` runs, then one traced run for
+    peak memory. profile=True adds a cProfile run and prints its top
+    functions by cumulative time.
+    Returns: {"seconds": ..., "peak_kb": ..., "counters": {...}}
+    """
+    run = CASES[name](seed)
+    best = None
+    counters = {}
+    for _ in range(repeat):
+        counters = {}
+        t0 = time.perf_counter()
+        run(counters)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    run({})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if profile:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(run, {})
+        print(f"--- profile: {name}")
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumulative").print_stats(profile_lines)
+
+    return {"seconds": best, "peak_kb": peak / 1024, "counters": counters}
+
+
+def compare(results, baseline, threshold=0.25, min_seconds=0.01, min_kb=64):
+    """
+    Regressions of `results` against `baseline` (both {name: result}):
+    time or peak memory more than `threshold` (fraction) above the
+    baseline, or changed counters. Growth below min_seconds / min_kb is
+    ignored, it is mostly noise on the small cases.
+    Returns: list of human-readable messages (empty = no regressions)
+    """
+    problems = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for key, floor in (("seconds", min_seconds), ("peak_kb", min_kb)):
+            if (base[key] > 0 and result[key] > base[key] * (1 + threshold)
+                    and result[key] - base[key] > floor):
+                problems.append(f"{name}: {key} {base[key]:.4g} -> {result[key]:.4g} "
+                                f"(+{result[key] / base[key] - 1:.0%})")
+        if result["counters"] != base["counters"]:
+            problems.append(f"{name}: counters {base['counters']} -> {result['counters']}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", action="append", choices=sorted(CASES),
+                        help="run only this case (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown / memory growth (default 0.25 = 25%%)")
+    parser.add_argument("--profile", action="store_true", help="cProfile every case")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    names = args.only or list(CASES)
+    results = {}
+    print(f"{'case':<34}{'seconds':>10}{'peak KB':>10}  counters")
+    for name in names:
+        result = run_case(name, args.seed, args.repeat, args.profile)
+        results[name] = result
+        counters = ", ".join(f"{k}={v}" for k, v in sorted(result["counters"].items()))
+        print(f"{name:<34}{result['seconds']:>10.4f}{result['peak_kb']:>10.0f}  {counters}")
+
+    if args.json:
+        report = {"python": platform.python_version(), "platform": platform.platform(),
+                  "seed": args.seed, "repeat": args.repeat, "results": results}
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"results written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        problems = compare(results, baseline, args.threshold)
+        for problem in problems:
+            print("REGRESSION", problem)
+        if problems:
+            return 1
+        print(f"no regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+'''Parallel Boruvka MST (multi-core alternative to Q8.kruskal).'''
+# Kruskal's main loop is one long sequential scan. Boruvka works in rounds
+# instead: every component picks its cheapest outgoing edge, all of those
+# edges join the tree, components merge, repeat (at most log2(n) rounds).
+# Picking the cheapest edges is a scan over all edges that splits cleanly:
+# every worker scans a slice of the edge arrays, which live in shared memory
+# together with the component label of every vertex, and the parent process
+# merges the per-slice minima. Edges that end up inside one component are
+# useless from then on, so every worker also compacts its slice in place
+# (a shared array of live edge indices) and later rounds scan fewer edges.
+#
+# Ties: edges are compared by (weight, edge index). That is a strict total
+# order, so the MST is unique -- the same tree kruskal() builds with its
+# stable sort -- and the result does not depend on the number of workers.
+
+import os
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from Q8 import intern_edges
+
+
+# Worker side: views on the shared arrays, attached once per process.
+_worker_shm = []
+_worker_us = _worker_vs = _worker_ws = _worker_comp = _worker_live = None
+
+
+def _attach(name, typecode):
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_shm.append(shm)  # keep the mapping alive as long as the view
+    return shm.buf.cast(typecode)
+
+
+def _init_worker(names, weight_type):
+    global _worker_us, _worker_vs, _worker_ws, _worker_comp, _worker_live
+    us_name, vs_name, ws_name, comp_name, live_name = names
+    _worker_us = _attach(us_name, 'q')
+    _worker_vs = _attach(vs_name, 'q')
+    _worker_ws = _attach(ws_name, weight_type)
+    _worker_comp = _attach(comp_name, 'q')
+    _worker_live = _attach(live_name, 'q')
+
+
+def _cheapest_edges(bounds):
+    """
+    Scan the live edges live[lo:hi]: returns ({component: cheapest edge
+    index leaving it}, number of edges kept), after moving the edges that
+    still join two components to the front of the slice.
+    """
+    lo, hi = bounds
+    us, vs, ws, comp, live = _worker_us, _worker_vs, _worker_ws, _worker_comp, _worker_live
+    best = {}
+    kept = lo
+    for p in range(lo, hi):
+        i = live[p]
+        a = comp[us[i]]
+        b = comp[vs[i]]
+        if a == b:
+            continue  # inside one component: drop it for good
+        live[kept] = i
+        kept += 1
+        w = ws[i]
+        # indices grow during the scan, so on equal weight the stored edge wins
+        j = best.get(a)
+        if j is None or w < ws[j]:
+            best[a] = i
+        j = best.get(b)
+        if j is None or w < ws[j]:
+            best[b] = i
+    return best, kept - lo
+
+
+def _shared_array(values, typecode, blocks):
+    """Copy values into a new shared memory block; returns (shm, view)."""
+    data = array(typecode, values)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+    blocks.append(shm)
+    view = shm.buf.cast(typecode)
+    view[:len(data)] = data
+    return shm, view
+
+
+def boruvka_arrays(us, vs, ws, num_vertices=None, workers=None, chunks_per_worker=4):
+    """
+    Parallel Boruvka over parallel arrays (same input as Q8.kruskal_arrays:
+    vertex ids 0..n-1 in us / vs, weights in ws).
+    workers: number of processes (default os.cpu_count(); 1 = no pool)
+    Returns: (indices of the MST edges, total_cost); the edge set is the
+             one kruskal_arrays returns, listed round by round
+    """
+    m = len(ws)
+    if num_vertices is None:
+        num_vertices = max(max(us, default=-1), max(vs, default=-1)) + 1
+    n = num_vertices
+    if m == 0 or n <= 1:
+        return array('q'), 0  # nothing to connect (shared blocks cannot be empty)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    weight_type = 'q' if all(isinstance(w, int) for w in ws) else 'd'
+
+    num_chunks = max(1, workers * chunks_per_worker)
+    step = max(1, -(-m // num_chunks))
+    bounds = [(lo, min(lo + step, m)) for lo in range(0, m, step)]
+
+    blocks = []
+    views = []
+    pool = None
+    try:
+        names = []
+        for values, typecode in ((us, 'q'), (vs, 'q'), (ws, weight_type),
+                                 (range(n), 'q'), (range(m), 'q')):
+            shm, view = _shared_array(values, typecode, blocks)
+            names.append(shm.name)
+            views.append(view)
+        comp = views[3]
+
+        if workers == 1:
+            _init_worker(names, weight_type)
+            scan = lambda: list(map(_cheapest_edges, bounds))
+        else:
+            pool = Pool(workers, initializer=_init_worker, initargs=(names, weight_type))
+            scan = lambda: pool.map(_cheapest_edges, bounds, chunksize=1)
+
+        parent = array('q', range(n))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        mst = array('q')
+        total_cost = 0
+        while len(mst) < n - 1:
+            # 1) cheapest outgoing edge per component, merged over the slices
+            best = {}
+            results = scan()
+            bounds = [(lo, lo + kept) for (lo, _), (_, kept) in zip(bounds, results)]
+            for partial, _ in results:
+                for c, i in partial.items():
+                    j = best.get(c)
+                    if j is None or (ws[i], i) < (ws[j], j):
+                        best[c] = i
+            if not best:
+                break  # the remaining components are not connected
+
+            # 2) add them (an edge chosen by both its ends only once)
+            for i in sorted(set(best.values())):
+                a = find(us[i])
+                b = find(vs[i])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+                    mst.append(i)
+                    total_cost += ws[i]
+
+            # 3) new component labels for the next round
+            for v in range(n):
+                comp[v] = find(v)
+        return mst, total_cost
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if workers == 1:
+            _release_worker()
+        for view in views:
+            view.release()
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _release_worker():
+    """Drop the in-process views (workers=1) so the blocks can be closed."""
+    global _worker_us, _worker_vs, _worker_ws, _worker_comp, _worker_live
+    for view in (_worker_us, _worker_vs, _worker_ws, _worker_comp, _worker_live):
+        if view is not None:
+            view.release()
+    _worker_us = _worker_vs = _worker_ws = _worker_comp = _worker_live = None
+    while _worker_shm:
+        _worker_shm.pop().close()
+
+
+def boruvka(edges, workers=None):
+    """
+    Same input and output as Q8.kruskal(edges): list of (u, v, w) tuples in,
+    (mst_edges, total_cost) out; same tree and total_cost as kruskal.
+    """
+    labels, us, vs, ws = intern_edges(edges)
+    mst, total_cost = boruvka_arrays(us, vs, ws, len(labels), workers)
+    return [(labels[us[i]], labels[vs[i]], ws[i]) for i in mst], total_cost
+
+
+# ---------- Benchmark ----------
+
+def benchmark(n=100000, m=1000000, worker_counts=(1, 2, 4, 8), seed=0):
+    """Sequential kruskal / kruskal_arrays against boruvka_arrays on 1..N workers."""
+    import time
+    from Q8 import kruskal, kruskal_arrays, random_edges
+
+    edges = random_edges(n, m, seed)
+    _, us, vs, ws = intern_edges(edges)
+
+    def timed(func):
+        t0 = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - t0
+
+    print(f"graph: {n} vertices, {m} edges, {os.cpu_count()} CPUs")
+    print(f"{'engine':<18}{'workers':>8}{'time (s)':>10}{'cost':>12}")
+    (_, expected), elapsed = timed(lambda: kruskal(edges))
+    print(f"{'kruskal':<18}{1:>8}{elapsed:>10.3f}{expected:>12}")
+    (tree, cost), elapsed = timed(lambda: kruskal_arrays(us, vs, ws))
+    print(f"{'kruskal_arrays':<18}{1:>8}{elapsed:>10.3f}{cost:>12}")
+    for workers in worker_counts:
+        (result, cost), elapsed = timed(lambda: boruvka_arrays(us, vs, ws, n, workers))
+        assert cost == expected and sorted(result) == sorted(tree)
+        print(f"{'boruvka_arrays':<18}{workers:>8}{elapsed:>10.3f}{cost:>12}")
+
+
+if __name__ == "__main__":
+    example_edges = [
+        (0, 1, 4), (0, 7, 8), (1, 7, 11), (1, 2, 8), (7, 8, 7), (7, 6, 1),
+        (2, 8, 2), (8, 6, 6), (2, 3, 7), (2, 5, 4), (6, 5, 2), (3, 5, 14),
+        (3, 4, 9), (4, 5, 10)
+    ]
+    mst, cost = boruvka(example_edges, workers=2)
+    print("MST edges:", mst)
+    print("Total MST cost:", cost)
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
@@ -0,0 +1,212 @@
+'''Asyncio chat server for the Q9 chatbot: many sessions at once over a local
+TCP or Unix socket.'''
+# Protocol: UTF-8 text, one message per line in both directions. The server
+# greets every new session, answers each line with Q9.respond and closes the
+# connection after "bye".
+# - per-session state: the dict Q9.respond returns, kept in a Session
+# - idle timeout: a session that sends nothing for idle_timeout seconds is
+#   told so and disconnected
+# - backpressure: a session reads its next line only after the previous
+#   reply has been flushed (writer.drain()), so a client that does not read
+#   its replies stops being served instead of filling server memory. If a
+#   flush takes longer than idle_timeout the client is not reading at all:
+#   the session is evicted and its connection aborted, so such clients
+#   cannot hold on to session slots. Lines are capped at max_line bytes,
+#   and above max_sessions new connections are turned away with a "busy" line
+
+import asyncio
+import itertools
+import time
+
+from Q9 import respond
+
+GREETING = "Hello! Welcome to ABC Store. How can I help you today?"
+
+
+class Session:
+    """State of one connected client."""
+
+    def __init__(self, session_id, peer):
+        self.id = session_id
+        self.peer = peer
+        self.state = None      # Q9.respond state
+
+
+class ChatServer:
+    """
+    host / port: TCP address (port 0 = any free port, see self.address)
+    path: Unix socket path instead of TCP
+    max_sessions: concurrent sessions; further connections get "busy"
+    idle_timeout: seconds of silence before a session is evicted
+    max_line: longest accepted message in bytes
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, path=None, max_sessions=10000,
+                 idle_timeout=300.0, max_line=4096):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.sessions = {}
+        self.stats = {"sessions": 0, "messages": 0, "rejected": 0, "evicted": 0}
+        self._ids = itertools.count(1)
+        self._server = None
+
+    async def start(self):
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, self.path, limit=self.max_line, backlog=1024)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port, limit=self.max_line, backlog=1024)
+        return self
+
+    @property
+    def address(self):
+        """(host, port) actually bound, or the Unix socket path."""
+        if self.path is not None:
+            return self.path
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _send(self, writer, line):
+        """
+        Write one line and wait while the client's socket buffer is full,
+        at most idle_timeout seconds (asyncio.TimeoutError after that).
+        """
+        writer.write(line.encode() + b"\n")
+        await asyncio.wait_for(writer.drain(), self.idle_timeout)
+
+    async def _handle(self, reader, writer):
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            try:
+                await self._send(writer, "busy, please try again later")
+            except (ConnectionError, asyncio.TimeoutError):
+                writer.transport.abort()
+            finally:
+                writer.close()
+            return
+
+        session = Session(next(self._ids), writer.get_extra_info("peername"))
+        self.sessions[session.id] = session
+        self.stats["sessions"] += 1
+        evicted = False
+        try:
+            await self._send(writer, GREETING)
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    evicted = True
+                    await self._send(writer, "idle timeout, goodbye")
+                    break
+                except ValueError:  # line longer than max_line
+                    await self._send(writer, "message too long")
+                    break
+                if not line:
+                    break  # client closed the connection
+                reply, session.state = respond(line.decode(errors="replace").strip(),
+                                               session.state)
+                self.stats["messages"] += 1
+                await self._send(writer, reply)
+                if session.state["done"]:
+                    break
+        except asyncio.TimeoutError:
+            # a reply could not be flushed in time: the client is not reading.
+            # close() would wait for the unsent data, so drop the connection
+            evicted = True
+            writer.transport.abort()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if evicted:
+                self.stats["evicted"] += 1
+            del self.sessions[session.id]
+            writer.close()
+
+
+# ---------- Load generator ----------
+
+MESSAGES = ["hi", "what does it cost", "where is my order", "opening times?",
+            "can I return this", "sometimes I wonder"]
+
+
+async def _client(address, messages, latencies):
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address)
+    try:
+        await reader.readline()  # greeting
+        for message in messages:
+            t0 = time.perf_counter()
+            writer.write(message.encode() + b"\n")
+            await writer.drain()
+            reply = await reader.readline()
+            if not reply:
+                break
+            latencies.append(time.perf_counter() - t0)
+    finally:
+        writer.close()
+
+
+async def load_test(address, clients=1000, messages_per_client=20, seed=0):
+    """
+    Run `clients` concurrent sessions against a server, each sending
+    messages_per_client messages and waiting for every reply.
+    Returns: dict with "messages", "seconds", "msgs_per_sec", "p50_ms", "p99_ms"
+    """
+    import random
+    rng = random.Random(seed)
+    latencies = []
+    scripts = [[rng.choice(MESSAGES) for _ in range(messages_per_client)]
+               for _ in range(clients)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(address, script, latencies) for script in scripts))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {"messages": len(latencies), "seconds": elapsed,
+            "msgs_per_sec": len(latencies) / elapsed,
+            "p50_ms": percentile(0.50), "p99_ms": percentile(0.99)}
+
+
+def benchmark(client_counts=(10, 100, 1000, 5000), messages_per_client=20):
+    """Server and load generator in one event loop on a local TCP port."""
+
+    async def run():
+        server = await ChatServer(max_sessions=max(client_counts)).start()
+        print(f"{'clients':>8}{'messages':>10}{'msg/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+        for clients in client_counts:
+            result = await load_test(server.address, clients, messages_per_client)
+            print(f"{clients:>8}{result['messages']:>10}{result['msgs_per_sec']:>10.0f}"
+                  f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+        await server.close()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        # python chat_server.py [port], then e.g.: nc 127.0.0.1 8765
+        port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+        server = ChatServer(port=port)
+        print(f"Chat server on 127.0.0.1:{port}")
+        asyncio.run(server.serve_forever())
@@ -0,0 +1,319 @@
+'''Component-wise graph coloring (drop-in front end for Q6 / Q7).'''
+# Interference graphs are usually many small disconnected pieces, but Q6 and
+# Q7 search the whole adjacency list as one problem. Here instead:
+# 1) the graph is split into connected components (components.py)
+# 2) k0 = size of a greedy clique is a lower bound on the colors of the whole
+#    graph. A vertex with fewer than k0 neighbors can always be colored last
+#    (one of the colors 0..k0-1 is free), so such vertices are peeled off
+#    repeatedly; often whole components disappear this way
+# 3) what is left of every component (its core) is colored on a process pool
+# 4) peeled vertices are put back in reverse order with their smallest free
+#    color. The number of colors is the max over the components.
+
+import os
+import time
+from multiprocessing import Pool
+
+import Q6
+import Q7
+from components import connected_components
+
+
+def split_components(graph):
+    """Connected components of a list-of-lists graph as sorted vertex lists."""
+    comps = connected_components(graph, workers=1)
+    members = [[] for _ in range(len(comps))]
+    for v, c in enumerate(comps.component):
+        members[c].append(v)
+    return members
+
+
+def peel(graph, vertices, bound):
+    """
+    Repeatedly remove vertices with fewer than `bound` neighbors left.
+    Returns: (core, peeled) -- the remaining vertices and the removed ones
+             in removal order (color them back in reverse order)
+    """
+    alive = set(vertices)
+    neighbors = {v: set(graph[v]) - {v} for v in vertices}
+    degree = {v: len(neighbors[v]) for v in vertices}
+    stack = [v for v in vertices if degree[v] < bound]
+    peeled = []
+    while stack:
+        v = stack.pop()
+        alive.discard(v)
+        peeled.append(v)
+        for u in neighbors[v]:
+            if u in alive:
+                degree[u] -= 1
+                if degree[u] == bound - 1:  # just dropped below the bound
+                    stack.append(u)
+    return [v for v in vertices if v in alive], peeled
+
+
+def _subgraph(graph, vertices):
+    """Induced subgraph renumbered 0..len(vertices)-1."""
+    local = {v: i for i, v in enumerate(vertices)}
+    return [[local[u] for u in graph[v] if u in local] for v in vertices]
+
+
+def _solve_task(args, on_improve=None):
+    """
+    Color one core; returns (index, assignment, stats).
+    deadline: wall-clock time (time.time()) shared by all cores, turned into
+              the time_limit left when this core's search starts
+    on_improve: in-process only, forwarded to the core's search
+    """
+    index, solver, subgraph, options, deadline = args
+    stats = {}
+    if solver is Q6.graph_coloring_branch_and_bound:
+        options = dict(options, stats=stats, on_improve=on_improve)
+        if deadline is not None:
+            options["time_limit"] = max(0.0, deadline - time.time())
+    _, assignment = solver(subgraph, **options)
+    return index, assignment or [], stats
+
+
+def _color_components(graph, solver, workers, options, info=None,
+                      time_limit=None, on_improve=None):
+    """
+    Steps 1-4 above, with solver(subgraph, **options) coloring every core.
+    time_limit: seconds for all cores together (Q6 solver only)
+    on_improve: callback(colors, assignment) with full colorings of the
+                whole graph: first the greedy one, then each time a core's
+                search makes the whole coloring use fewer colors
+    info: optional dict, receives "components", "cores", "peeled", "bound"
+          and the per-core solver stats as "core_stats"
+    Returns: (colors_used, assignment)
+    """
+    n = len(graph)
+    deadline = None if time_limit is None else time.time() + time_limit
+    bound = len(Q6.greedy_clique(graph))
+    components = split_components(graph)
+    cores = []
+    core_colors = []  # colors of the best coloring of every core so far
+    peeled_all = []
+    assignment = [-1] * n
+    for vertices in components:
+        core, peeled = peel(graph, vertices, bound)
+        peeled_all.append(peeled)
+        if not core:
+            continue
+        # the whole graph needs `bound` colors anyway: a core that greedy
+        # DSATUR colors within the bound needs no exact search; otherwise
+        # its DSATUR coloring is the starting point
+        used, local = Q6.dsatur_greedy(_subgraph(graph, core))
+        for v, c in zip(core, local):
+            assignment[v] = c
+        if used > bound:
+            cores.append(core)
+            core_colors.append(used)
+
+    def color_peeled():
+        # every peeled vertex has fewer than `bound` colored neighbors when
+        # it is colored back, so it never needs a new color
+        for peeled in peeled_all:
+            for v in peeled:
+                assignment[v] = -1
+        for peeled in peeled_all:
+            for v in reversed(peeled):
+                taken = {assignment[u] for u in graph[v]}
+                c = 0
+                while c in taken:
+                    c += 1
+                assignment[v] = c
+
+    reported = None
+
+    def update(index, local):
+        """Take a core coloring if it beats that core's best; report progress."""
+        nonlocal reported
+        used = max(local) + 1 if local else 0
+        if local and used < core_colors[index]:
+            core_colors[index] = used
+            for v, c in zip(cores[index], local):
+                assignment[v] = c
+        if on_improve is not None:
+            color_peeled()
+            colors = max(assignment) + 1 if n else 0
+            if reported is None or colors < reported:
+                reported = colors
+                on_improve(colors, assignment.copy())
+
+    if on_improve is not None and n:
+        color_peeled()
+        reported = max(assignment) + 1
+        on_improve(reported, assignment.copy())
+
+    # largest cores first, so a long search does not start last
+    tasks = [(i, solver, _subgraph(graph, core), options, deadline)
+             for i, core in enumerate(cores)]
+    tasks.sort(key=lambda task: -len(task[2]))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    pool = None
+    if workers == 1 or len(tasks) <= 1:
+        # in-process: core improvements can be reported as they happen
+        def solve(task):
+            index = task[0]
+            callback = None
+            if on_improve is not None:
+                callback = lambda colors, local: update(index, local)
+            return _solve_task(task, callback)
+        results = map(solve, tasks)
+    else:
+        # callbacks cannot cross processes: a core is reported when it is done
+        pool = Pool(min(workers, len(tasks)))
+        results = pool.imap_unordered(_solve_task, tasks, chunksize=1)
+
+    core_stats = []
+    try:
+        for index, local, stats in results:
+            update(index, local)
+            core_stats.append(stats)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    color_peeled()
+    if info is not None:
+        info.update(components=len(components), cores=len(cores), bound=bound,
+                    peeled=sum(map(len, peeled_all)), core_stats=core_stats)
+    return (max(assignment) + 1 if n else 0), assignment
+
+
+def graph_coloring_branch_and_bound(graph, time_limit=None, node_limit=None,
+                                    on_improve=None, tabu_iters=1000, stats=None,
+                                    *, workers=None):
+    """
+    Drop-in for Q6.graph_coloring_branch_and_bound (same parameters in the
+    same order), solved per component.
+    time_limit: seconds for the whole call; all cores share one deadline
+    node_limit: search nodes per core (every core has its own counter)
+    on_improve: callback(colors, assignment) with colorings of the whole
+                graph (original vertex ids), first the greedy one, then every
+                improvement; with a pool a core is reported once it finishes
+    workers: number of processes (default os.cpu_count(); 1 = no pool)
+    stats: optional dict, receives "lower_bound", "optimal", "nodes" and
+           "seconds" combined over the cores, plus "components", "cores"
+           and "peeled" (number of vertices removed before the search)
+    Returns: (best_colors, best_assignment)
+    """
+    start = time.perf_counter()
+    info = {}
+    colors, assignment = _color_components(
+        graph, Q6.graph_coloring_branch_and_bound, workers,
+        {"node_limit": node_limit, "tabu_iters": tabu_iters}, info,
+        time_limit=time_limit, on_improve=on_improve)
+    if stats is not None:
+        core_stats = info.pop("core_stats")
+        lower_bound = max([info.pop("bound")] + [s["lower_bound"] for s in core_stats])
+        stats.update(info)
+        stats.update(lower_bound=lower_bound,
+                     optimal=colors == lower_bound or all(s["optimal"] for s in core_stats),
+                     nodes=sum(s["nodes"] for s in core_stats),
+                     seconds=time.perf_counter() - start)
+    return colors, assignment
+
+
+def find_smallest_coloring(graph, strategy="down", *, workers=None):
+    """
+    Drop-in for Q7.find_smallest_coloring, solved per component.
+    workers: number of processes (default os.cpu_count(); 1 = no pool)
+    Returns: (k, colors), or (None, None) for an empty graph
+    """
+    if len(graph) == 0:
+        return None, None
+    return _color_components(graph, Q7.find_smallest_coloring, workers,
+                             {"strategy": strategy})
+
+
+# ---------- Benchmark ----------
+
+def disjoint_union(graphs):
+    """Put list-of-lists graphs side by side (vertex ids shifted)."""
+    union = []
+    for g in graphs:
+        offset = len(union)
+        union.extend([u + offset for u in nbrs] for nbrs in g)
+    return union
+
+
+def mycielski(graph):
+    """
+    Mycielski construction: triangle-free stays triangle-free while the
+    chromatic number grows by one -- the clique bound is then useless and
+    the exact searches have to prove optimality the hard way.
+    mycielski(mycielski([[1], [0]])) is the 11-vertex Groetzsch graph (4 colors).
+    """
+    n = len(graph)
+    result = [list(nbrs) for nbrs in graph] + [[] for _ in range(n + 1)]
+    for v in range(n):
+        for u in graph[v]:
+            result[n + v].append(u)
+            result[u].append(n + v)
+        result[n + v].append(2 * n)
+        result[2 * n].append(n + v)
+    return result
+
+
+def benchmark(piece_counts=(2, 4, 8), trees=200, seed=0, workers=None, time_limit=30):
+    """
+    Whole-graph search against the component-wise drop-ins on graphs made of
+    several Groetzsch graphs plus `trees` random trees (removed entirely by
+    peeling). The whole-graph branch and bound gets `time_limit` seconds.
+    """
+    import random
+
+    groetzsch = mycielski(mycielski([[1], [0]]))
+    rng = random.Random(seed)
+
+    def timed(func):
+        t0 = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - t0
+
+    print(f"{os.cpu_count()} CPUs, * = whole-graph search stopped by the time limit")
+    print(f"{'pieces':>7}{'n':>6}{'solver':>8}{'colors':>8}{'whole (s)':>11}"
+          f"{'split (s)':>11}{'split x1 (s)':>14}")
+    for pieces in piece_counts:
+        graphs = [groetzsch] * pieces
+        for _ in range(trees):
+            tree = [[] for _ in range(rng.randint(2, 8))]
+            for v in range(1, len(tree)):
+                u = rng.randrange(v)
+                tree[u].append(v)
+                tree[v].append(u)
+            graphs.append(tree)
+        rng.shuffle(graphs)
+        graph = disjoint_union(graphs)
+        n = len(graph)
+
+        for name, whole, split in (
+                ("Q6", lambda info: Q6.graph_coloring_branch_and_bound(
+                    graph, time_limit=time_limit, stats=info),
+                 lambda w: graph_coloring_branch_and_bound(graph, workers=w)),
+                ("Q7", lambda info: Q7.find_smallest_coloring(graph),
+                 lambda w: find_smallest_coloring(graph, workers=w))):
+            info = {"optimal": True}
+            _, t_whole = timed(lambda: whole(info))
+            (k, colors), t_split = timed(lambda: split(workers))
+            _, t_single = timed(lambda: split(1))
+            assert all(colors[u] != colors[v] for u in range(n) for v in graph[u])
+            whole_col = f"{t_whole:.3f}" + ("" if info["optimal"] else "*")
+            print(f"{pieces:>7}{n:>6}{name:>8}{k:>8}{whole_col:>11}"
+                  f"{t_split:>11.3f}{t_single:>14.3f}")
+
+
+if __name__ == "__main__":
+    # triangle, a separate square and an isolated vertex
+    graph = [[1, 2], [0, 2], [0, 1], [4, 6], [3, 5], [4, 6], [3, 5], []]
+    print("components:", split_components(graph))
+    info = {}
+    print("branch and bound:", graph_coloring_branch_and_bound(graph, stats=info))
+    print("peeled vertices:", info["peeled"], "optimal:", info["optimal"])
+    print("smallest coloring:", find_smallest_coloring(graph))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
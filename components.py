@@ -0,0 +1,288 @@
+'''Connected components over a process pool (parallel version of the
+whole-graph loops in Q1 / Q2.bfs_recursive_full).'''
+# The vertex range is split into one chunk per worker, cut so every chunk
+# holds about the same number of edges.
+# 1) every worker labels its chunk with a DFS over the edges inside it:
+#    rep[v] = smallest vertex of v's piece, written to a shared array
+# 2) every worker turns the edges leaving its chunk into pairs of pieces
+#    (rep[v], rep[t]), deduplicated in C (map / zip / set) and thinned to
+#    a spanning forest, so at most one link per piece comes back instead
+#    of one entry per edge
+# 3) the parent unions those pairs over the pieces and relabels all vertices
+#    with one C-level map; components are numbered in order of their
+#    smallest vertex id
+# With one worker there is a single chunk: step 1 is the whole job.
+
+import os
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain, repeat
+from multiprocessing import Pool, shared_memory
+from operator import sub
+
+from csr import CSRGraph
+
+
+class Components:
+    """
+    Result of connected_components, cheap to query repeatedly.
+    component: array, component[i] = component id of vertex id i
+    sizes: list, sizes[c] = number of vertices in component c
+    """
+
+    def __init__(self, graph, component, sizes):
+        self.graph = graph
+        self.component = component
+        self.sizes = sizes
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def component_of(self, vertex):
+        return self.component[self.graph.index[vertex]]
+
+    def size_of(self, vertex):
+        return self.sizes[self.component_of(vertex)]
+
+    def connected(self, u, v):
+        return self.component_of(u) == self.component_of(v)
+
+    def members(self, c):
+        labels = self.graph.labels
+        return [labels[i] for i, comp in enumerate(self.component) if comp == c]
+
+
+# Worker side: the CSR arrays are handed over once per process, the rep
+# array lives in shared memory.
+_worker_offsets = None
+_worker_targets = None
+_worker_rep = None
+_worker_shm = None
+
+
+def _init_worker(offsets, targets, rep_name):
+    global _worker_offsets, _worker_targets, _worker_rep, _worker_shm
+    _worker_offsets = offsets
+    _worker_targets = targets
+    _worker_shm = shared_memory.SharedMemory(name=rep_name)
+    _worker_rep = _worker_shm.buf.cast('q')
+
+
+def _label_chunk(bounds):
+    """
+    Step 1 for vertices lo..hi-1. Returns the pairs of pieces joined by an
+    edge the DFS could not follow because it is only listed from the other
+    end (none for symmetric adjacency lists).
+    """
+    lo, hi = bounds
+    offsets = _worker_offsets
+    targets = _worker_targets
+    rep = _worker_rep
+    joins = []
+    for s in range(lo, hi):
+        if rep[s] >= 0:
+            continue
+        rep[s] = s
+        stack = [s]
+        while stack:
+            x = stack.pop()
+            for t in targets[offsets[x]:offsets[x + 1]]:
+                if lo <= t < hi:
+                    r = rep[t]
+                    if r < 0:
+                        rep[t] = s
+                        stack.append(t)
+                    elif r != s:
+                        joins.append((r, s))
+    return joins
+
+
+def _boundary_pairs(bounds):
+    """Step 2 for vertices lo..hi-1: the links between pieces, as a forest."""
+    lo, hi = bounds
+    offsets = _worker_offsets
+    targets = _worker_targets
+    rep = _worker_rep
+    degrees = map(sub, offsets[lo + 1:hi + 1], offsets[lo:hi])
+    sources = chain.from_iterable(map(repeat, rep[lo:hi], degrees))
+    ends = map(rep.__getitem__, targets[offsets[lo]:offsets[hi]])
+    return _forest(set(zip(sources, ends)))
+
+
+def _forest(pairs):
+    """
+    Keep only the pairs that join two different sets (a spanning forest of
+    the pieces), so the parent merges at most one link per piece.
+    """
+    parent = {}
+    forest = []
+
+    def find(x):
+        root = x
+        while root in parent:
+            root = parent[root]
+        while x != root:  # path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    for a, b in pairs:
+        a = find(a)
+        b = find(b)
+        if a != b:
+            parent[a] = b
+            forest.append((a, b))
+    return forest
+
+
+def connected_components(graph, workers=None, stats=None):
+    """
+    Connected components of an undirected graph using a process pool.
+    graph: dict of neighbor lists or a CSRGraph. Only a CSRGraph caches its
+           result (a dict can change between calls, so it is converted and
+           recomputed every time); build one to answer repeated calls.
+    workers: number of processes (default: os.cpu_count(); 1 = no pool)
+    stats: optional dict, receives "chunks", "pairs" (piece links
+           merged by the parent) and "merge_seconds" (parent-side work)
+    Returns: Components (component id per vertex id + component sizes);
+             component ids follow the order of each component's first vertex,
+             i.e. the order dfs_all_components / bfs_full discover them.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+    if csr._components is not None:
+        return csr._components
+
+    n = len(csr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    offsets = csr.offsets
+
+    # one chunk per worker, about the same number of edges in each
+    per_chunk = max(1, -(-len(csr.targets) // max(1, workers)))
+    bounds = []
+    lo = 0
+    while lo < n:
+        hi = max(lo + 1, bisect_left(offsets, offsets[lo] + per_chunk, lo + 1, n))
+        bounds.append((lo, hi))
+        lo = hi
+
+    global _worker_offsets, _worker_targets, _worker_rep
+    if workers == 1 or len(bounds) <= 1:
+        _worker_offsets, _worker_targets = offsets, csr.targets
+        _worker_rep = rep = array('q', [-1]) * n
+        try:
+            pairs = [pair for chunk in bounds for pair in _label_chunk(chunk)]
+            if len(bounds) > 1:
+                pairs.extend(pair for chunk in bounds for pair in _boundary_pairs(chunk))
+        finally:
+            _worker_offsets = _worker_targets = _worker_rep = None
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=8 * n)
+        view = shm.buf.cast('q')
+        try:
+            view[:] = array('q', [-1]) * n
+            with Pool(min(workers, len(bounds)), initializer=_init_worker,
+                      initargs=(offsets, csr.targets, shm.name)) as pool:
+                pairs = [pair for joins in pool.map(_label_chunk, bounds) for pair in joins]
+                for links in pool.map(_boundary_pairs, bounds):
+                    pairs.extend(links)
+            rep = array('q', view)
+        finally:
+            view.release()
+            shm.close()
+            shm.unlink()
+
+    # merge: union-find over the pieces, smaller id as root
+    t0 = time.perf_counter()
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:  # path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    for a, b in pairs:
+        a = find(a)
+        b = find(b)
+        if a != b:
+            if a < b:
+                parent[b] = a
+            else:
+                parent[a] = b
+
+    # the root of a component is its smallest vertex, which is also a piece
+    # rep, so visiting the reps in increasing order numbers the components
+    # in order of their first vertex
+    component_of = {}
+    ids = {}
+    for r in sorted(set(rep)):
+        root = find(r)
+        if root not in ids:
+            ids[root] = len(ids)
+        component_of[r] = ids[root]
+    component = array('q', map(component_of.__getitem__, rep))
+    counts = Counter(component)
+    sizes = [counts[c] for c in range(len(ids))]
+
+    if stats is not None:
+        stats.update(chunks=len(bounds), pairs=len(pairs),
+                     merge_seconds=time.perf_counter() - t0)
+    result = Components(csr, component, sizes)
+    csr._components = result
+    return result
+
+
+# ---------- Benchmark ----------
+
+def benchmark(n=200000, avg_degree=8, worker_counts=(1, 2, 4, 8), seed=0):
+    """
+    Time connected_components on a random graph for several worker counts,
+    next to the sequential Q1.dfs_all_components over the same CSRGraph.
+    """
+    from Q1 import dfs_all_components, random_graph
+
+    csr = CSRGraph.from_adjacency(random_graph(n, avg_degree, seed))
+    print(f"graph: {n} vertices, {csr.num_edges()} adjacency entries, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'method':<22}{'time (s)':>10}{'components':>12}{'pairs':>9}{'merge (s)':>11}")
+
+    t0 = time.perf_counter()
+    count = 1 + max((c for c, _ in dfs_all_components(csr, with_component=True)), default=-1)
+    elapsed = time.perf_counter() - t0
+    print(f"{'dfs_all_components':<22}{elapsed:>10.3f}{count:>12}{'-':>9}{'-':>11}")
+
+    for workers in worker_counts:
+        csr._components = None  # drop the cache so every run does the work
+        stats = {}
+        t0 = time.perf_counter()
+        result = connected_components(csr, workers=workers, stats=stats)
+        elapsed = time.perf_counter() - t0
+        assert len(result) == count
+        name = f"workers={workers}"
+        print(f"{name:<22}{elapsed:>10.3f}{len(result):>12}{stats['pairs']:>9}"
+              f"{stats['merge_seconds']:>11.3f}")
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E'],
+        'G': []
+    }
+    comps = connected_components(graph, workers=2)
+    print("Number of components:", len(comps))
+    print("Component sizes:", comps.sizes)
+    print("A and F connected:", comps.connected('A', 'F'))
+    print("A and G connected:", comps.connected('A', 'G'))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
@@ -0,0 +1,194 @@
+'''Compact CSR (compressed sparse row) graph shared by the DFS/BFS traversals.'''
+# Vertex labels are interned to integer ids 0..n-1 and the adjacency lists are
+# stored back to back in one typed array:
+#   neighbors of id i  ->  targets[offsets[i]:offsets[i + 1]]
+# This uses a few bytes per edge instead of a Python list entry + object each.
+
+from array import array
+
+
+class CSRGraph:
+    """
+    Read-only graph in compressed sparse row form.
+    labels:  list, labels[i] is the original vertex label of id i
+    index:   dict, label -> id
+    offsets: array of n + 1 ints, start of each vertex's neighbor block
+    targets: array of neighbor ids
+    weights: array of edge weights parallel to targets (or None)
+    """
+
+    def __init__(self, labels, offsets, targets, weights=None):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._components = None  # cache filled by components.connected_components
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """
+        Build from the dict-of-lists format used by Q1/Q2, e.g. {'A': ['B'], ...}.
+        Ids follow the key order of `graph` (so whole-graph traversals keep
+        their order); neighbors that are not keys get ids after them.
+        A list of lists (vertices 0..n-1, as in Q6/Q7) is accepted too.
+        """
+        if isinstance(graph, (list, tuple)):
+            graph = dict(enumerate(graph))
+
+        keys = list(graph)
+        labels = list(keys)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        targets = array('q')
+        for label in keys:
+            for neighbor in graph[label]:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                targets.append(index[neighbor])
+            offsets.append(len(targets))
+
+        # vertices that only appear as neighbors have no edges of their own
+        for _ in range(len(labels) - (len(offsets) - 1)):
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets)
+
+    @classmethod
+    def from_edges(cls, edges, directed=False):
+        """
+        Build from an edge list like the one Q8.kruskal consumes:
+        tuples (u, v, w) or (u, v). Undirected edges are stored both ways.
+        Ids follow the order in which vertices first appear in `edges`.
+        """
+        labels = []
+        index = {}
+        src = array('q')
+        dst = array('q')
+        wts = array('d')
+        weighted = None
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            if weighted is None:
+                weighted = len(edge) > 2
+            for label in (u, v):
+                if label not in index:
+                    index[label] = len(labels)
+                    labels.append(label)
+            src.append(index[u])
+            dst.append(index[v])
+            if weighted:
+                wts.append(edge[2])
+            if not directed:
+                src.append(index[v])
+                dst.append(index[u])
+                if weighted:
+                    wts.append(edge[2])
+
+        # counting sort of the edges by source id (stable, keeps input order)
+        n = len(labels)
+        offsets = array('q', [0]) * (n + 1)
+        for s in src:
+            offsets[s + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = array('q', offsets[:n])
+        targets = array('q', [0]) * len(dst)
+        weights = array('d', [0.0]) * len(dst) if weighted else None
+        for k in range(len(src)):
+            pos = fill[src[k]]
+            targets[pos] = dst[k]
+            if weighted:
+                weights[pos] = wts[k]
+            fill[src[k]] = pos + 1
+        return cls(labels, offsets, targets, weights)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def num_edges(self):
+        """Number of stored (directed) adjacency entries."""
+        return len(self.targets)
+
+    def neighbors(self, i):
+        """Neighbor ids of vertex id i (a slice of the targets array)."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def to_adjacency(self):
+        """Convert back to the dict-of-lists format (labels as keys)."""
+        labels = self.labels
+        return {labels[i]: [labels[j] for j in self.neighbors(i)]
+                for i in range(len(labels))}
+
+    def nbytes(self):
+        """Approximate bytes used by the adjacency arrays."""
+        total = self.offsets.itemsize * len(self.offsets)
+        total += self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+
+# ---------- Benchmark ----------
+
+def benchmark(n=20000, avg_degree=8, seed=0):
+    """
+    Compare the dict-of-lists format with CSRGraph: memory to hold the graph
+    (measured with tracemalloc) and time of a full DFS / BFS over it.
+    """
+    import time
+    import tracemalloc
+    from Q1 import dfs_all_components, random_graph
+    from Q2 import bfs_recursive_full
+
+    def measure(build):
+        tracemalloc.start()
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return obj, size
+
+    def timed(func):
+        t0 = time.perf_counter()
+        func()
+        return time.perf_counter() - t0
+
+    graph, dict_bytes = measure(lambda: random_graph(n, avg_degree, seed))
+    csr, csr_bytes = measure(lambda: CSRGraph.from_adjacency(graph))
+    edges = sum(len(nbrs) for nbrs in graph.values())
+
+    print(f"graph: {n} vertices, {edges} adjacency entries")
+    print(f"{'format':<8}{'bytes/edge':>12}{'DFS (s)':>10}{'BFS (s)':>10}")
+    for name, g, size in (("dict", graph, dict_bytes), ("csr", csr, csr_bytes)):
+        dfs_time = f"{timed(lambda: list(dfs_all_components(g))):.3f}"
+        try:
+            bfs_time = f"{timed(lambda: bfs_recursive_full(g)):.3f}"
+        except RecursionError:
+            bfs_time = "recursion"
+        print(f"{name:<8}{size / edges:>12.1f}{dfs_time:>10}{bfs_time:>10}")
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E'],
+        'G': []
+    }
+    csr = CSRGraph.from_adjacency(graph)
+    print("labels:", csr.labels)
+    print("offsets:", list(csr.offsets))
+    print("targets:", list(csr.targets))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
@@ -0,0 +1,295 @@
+'''Batched account deposits on SQLite (Python counterpart of the Q10
+deposit_to_account procedure).'''
+# Q10 applies one deposit per procedure call: validate, START TRANSACTION,
+# SELECT ... FOR UPDATE, UPDATE, ROW_COUNT(), COMMIT. That is one round trip
+# and one transaction per deposit. DepositProcessor keeps the same checks
+# and the same "rows updated" report, but
+# - validates all deposits up front and groups them into batches
+# - adds up the deposits of one account inside a batch, so every account
+#   is written once per batch
+# - writes a batch with one executemany UPDATE in one transaction
+# - runs batches on worker threads that borrow connections from a pool
+# Balances are stored as integer cents (DECIMAL(12,2) in Q10), so sums are exact.
+
+import queue
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+INVALID_AMOUNT = "Invalid deposit amount. Amount must be greater than 0."
+MAX_CENTS = 10 ** 12 - 1  # 9,999,999,999.99, the largest DECIMAL(12,2) value
+
+
+def to_cents(amount):
+    """
+    Amount (int, str, Decimal or float) -> int cents, or None if not a finite
+    number or too large for DECIMAL(12,2) (above MAX_CENTS either way).
+    Rounds half up to 2 decimals, as MySQL does for DECIMAL(12,2).
+    """
+    if amount is None or isinstance(amount, bool):
+        return None
+    try:
+        value = Decimal(str(amount))
+        if not value.is_finite():
+            return None  # NaN / Infinity
+        value = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    except InvalidOperation:  # not a number, or too many digits
+        return None
+    cents = int(value * 100)
+    if abs(cents) > MAX_CENTS:
+        return None  # would not fit the column (nor SQLite's INTEGER)
+    return cents
+
+
+def from_cents(cents):
+    return (Decimal(cents) / 100).quantize(Decimal("0.01"))
+
+
+def connect(path, timeout=30.0):
+    """Connection in autocommit mode (transactions are started explicitly)."""
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None,
+                           check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def create_accounts(conn, accounts=()):
+    """
+    (Re)create the accounts table, like the setup part of Q10.
+    accounts: iterable of (holder_name, balance) rows to insert
+    """
+    conn.execute("DROP TABLE IF EXISTS accounts")
+    conn.execute("""
+        CREATE TABLE accounts (
+            account_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            holder_name TEXT NOT NULL,
+            balance_cents INTEGER NOT NULL DEFAULT 0
+        )""")
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO accounts (holder_name, balance_cents) VALUES (?, ?)",
+                     ((name, to_cents(balance)) for name, balance in accounts))
+    conn.execute("COMMIT")
+
+
+def balances(conn):
+    """{account_id: balance as Decimal}"""
+    return {acc: from_cents(cents) for acc, cents in
+            conn.execute("SELECT account_id, balance_cents FROM accounts")}
+
+
+def deposit_to_account(conn, acc_id, amount):
+    """
+    One deposit in its own transaction, step by step as in Q10.
+    Returns: {"message": ...} for an invalid amount or a missing account,
+             else {"account_id", "old_balance", "new_balance", "rows_updated"}
+    """
+    cents = to_cents(amount)
+    if cents is None or cents <= 0:
+        return {"message": INVALID_AMOUNT}
+
+    conn.execute("BEGIN IMMEDIATE")  # takes the write lock, like FOR UPDATE
+    try:
+        row = conn.execute("SELECT balance_cents FROM accounts WHERE account_id = ?",
+                           (acc_id,)).fetchone()
+        if row is None:
+            conn.execute("ROLLBACK")
+            return {"message": f"Account {acc_id} not found."}
+        cursor = conn.execute(
+            "UPDATE accounts SET balance_cents = balance_cents + ? WHERE account_id = ?",
+            (cents, acc_id))
+        rows_updated = cursor.rowcount  # ROW_COUNT() / SQL%ROWCOUNT
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    return {"account_id": acc_id, "old_balance": from_cents(row[0]),
+            "new_balance": from_cents(row[0] + cents), "rows_updated": rows_updated}
+
+
+class ConnectionPool:
+    """Fixed set of connections to one database file, shared by worker threads."""
+
+    def __init__(self, path, size=4):
+        self._idle = queue.Queue()
+        self._all = []
+        for _ in range(size):
+            conn = connect(path)
+            self._all.append(conn)
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self._idle.get()  # waits while all connections are busy
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        for conn in self._all:
+            conn.close()
+
+
+class DepositProcessor:
+    """
+    Apply many deposits in batched transactions.
+    pool: ConnectionPool (its size bounds how many batches run at once)
+    batch_size: deposits per transaction
+    workers: threads writing batches
+    """
+
+    def __init__(self, pool, batch_size=10000, workers=4):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.workers = workers
+
+    def _apply_batch(self, index, batch):
+        """
+        Write one batch of (account_id, cents) deposits.
+        Returns: per-batch report dict
+        """
+        t0 = time.perf_counter()
+        totals = {}
+        for acc_id, cents in batch:
+            totals[acc_id] = totals.get(acc_id, 0) + cents
+
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # accounts that do not exist get nothing, as in Q10
+                ids = list(totals)
+                existing = set()
+                for start in range(0, len(ids), 900):  # SQLite parameter limit
+                    chunk = ids[start:start + 900]
+                    marks = ",".join("?" * len(chunk))
+                    existing.update(acc for acc, in conn.execute(
+                        f"SELECT account_id FROM accounts WHERE account_id IN ({marks})", chunk))
+                cursor = conn.executemany(
+                    "UPDATE accounts SET balance_cents = balance_cents + ? WHERE account_id = ?",
+                    ((totals[acc], acc) for acc in ids if acc in existing))
+                rows_updated = cursor.rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        missing = [(acc, from_cents(cents)) for acc, cents in batch if acc not in existing]
+        return {"batch": index, "deposits": len(batch) - len(missing),
+                "accounts": len(existing), "rows_updated": rows_updated,
+                "not_found": missing, "seconds": time.perf_counter() - t0}
+
+    def process(self, deposits):
+        """
+        deposits: iterable of (account_id, amount)
+        Returns: {"batches": [per-batch reports], "invalid": [(account_id,
+                 amount) rejected by validation], "not_found": [...],
+                 "deposits": applied count, "rows_updated": total,
+                 "seconds": wall time, "deposits_per_sec": throughput}
+        """
+        t0 = time.perf_counter()
+        invalid = []
+        batches = [[]]
+        for acc_id, amount in deposits:
+            cents = to_cents(amount)
+            if cents is None or cents <= 0:
+                invalid.append((acc_id, amount))
+                continue
+            if len(batches[-1]) == self.batch_size:
+                batches.append([])
+            batches[-1].append((acc_id, cents))
+        if not batches[-1]:
+            batches.pop()
+
+        if self.workers == 1:
+            reports = [self._apply_batch(i, b) for i, b in enumerate(batches)]
+        else:
+            with ThreadPoolExecutor(self.workers) as executor:
+                reports = list(executor.map(self._apply_batch, range(len(batches)), batches))
+
+        elapsed = time.perf_counter() - t0
+        applied = sum(r["deposits"] for r in reports)
+        return {"batches": reports, "invalid": invalid,
+                "not_found": [d for r in reports for d in r["not_found"]],
+                "deposits": applied, "rows_updated": sum(r["rows_updated"] for r in reports),
+                "seconds": elapsed, "deposits_per_sec": applied / elapsed if elapsed else 0.0}
+
+
+# ---------- Benchmark ----------
+
+def random_deposits(num_deposits, num_accounts, seed=0, invalid_rate=0.01):
+    """Deposits skewed towards low account ids, with a few invalid ones."""
+    import random
+    rng = random.Random(seed)
+    deposits = []
+    for _ in range(num_deposits):
+        acc = min(int(rng.paretovariate(1.2)), num_accounts + 5)  # a few missing ids
+        if rng.random() < invalid_rate:
+            amount = rng.choice((0, -10, None, "abc"))
+        else:
+            amount = Decimal(rng.randint(1, 100000)) / 100
+        deposits.append((acc, amount))
+    return deposits
+
+
+def benchmark(num_accounts=10000, num_deposits=200000, single_limit=20000,
+              batch_size=10000, workers=4, seed=0):
+    """
+    Deposits/sec of the one-call-per-deposit path (on the first
+    single_limit deposits) against DepositProcessor on all of them; the
+    final balances of both are checked against each other.
+    """
+    import os
+    import tempfile
+
+    deposits = random_deposits(num_deposits, num_accounts, seed)
+    accounts = [(f"holder {i}", 0) for i in range(num_accounts)]
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for name in ("single", "batched"):
+            path = os.path.join(directory, f"{name}.db")
+            conn = connect(path)
+            create_accounts(conn, accounts)
+            if name == "single":
+                t0 = time.perf_counter()
+                for acc_id, amount in deposits[:single_limit]:
+                    deposit_to_account(conn, acc_id, amount)
+                rate = single_limit / (time.perf_counter() - t0)
+                print(f"one call per deposit: {single_limit} deposits, {rate:10.0f} deposits/s")
+                # finish the rest batched, only to compare the final balances
+                pool = ConnectionPool(path, 1)
+                DepositProcessor(pool, batch_size, 1).process(deposits[single_limit:])
+                pool.close()
+            else:
+                pool = ConnectionPool(path, workers)
+                report = DepositProcessor(pool, batch_size, workers).process(deposits)
+                pool.close()
+                print(f"batched ({batch_size}/batch, {workers} threads): {report['deposits']} "
+                      f"deposits, {report['deposits_per_sec']:10.0f} deposits/s, "
+                      f"{len(report['invalid'])} invalid, {len(report['not_found'])} not found")
+                print(f"{'batch':>7}{'deposits':>10}{'accounts':>10}{'rows':>8}{'ms':>9}")
+                for r in report["batches"][:5]:
+                    print(f"{r['batch']:>7}{r['deposits']:>10}{r['accounts']:>10}"
+                          f"{r['rows_updated']:>8}{r['seconds'] * 1000:>9.1f}")
+            results[name] = balances(conn)
+            conn.close()
+        assert results["single"] == results["batched"]
+        print("final balances identical")
+
+
+if __name__ == "__main__":
+    conn = connect(":memory:")
+    create_accounts(conn, [("Asha Kumar", "1000.00"), ("Rohit Patel", "2500.50"),
+                           ("Leena Shah", "0.00")])
+    # the three example calls of Q10
+    print(deposit_to_account(conn, 1, "500.00"))
+    print(deposit_to_account(conn, 2, "-100.00"))
+    print(deposit_to_account(conn, 99, "50.00"))
+    print(balances(conn))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
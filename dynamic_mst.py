@@ -0,0 +1,251 @@
+'''Dynamic minimum spanning tree: edge insertions and weight changes without
+rerunning Q8.kruskal over the whole edge list.'''
+# The tree is kept as an adjacency map (vertex -> {edge id: other end}) next
+# to all edges. Every update only touches the part of the tree it can affect:
+# - a new edge, or a non-tree edge that got cheaper, closes a cycle with the
+#   tree path between its ends: it replaces the heaviest edge on that path
+#   if it is lighter
+# - a tree edge that got heavier splits the tree in two when removed: the
+#   lightest edge crossing that cut (maybe the edge itself) reconnects it.
+#   Only the smaller half is walked, found by searching both halves in step
+# - anything else (a tree edge getting cheaper, a non-tree edge getting more
+#   expensive) cannot change the tree
+# Edges are compared by (weight, edge id), and edge ids follow input order,
+# so the tree is always the one kruskal() would build on the current edges.
+
+from collections import deque
+
+from Q8 import intern_edges, kruskal_arrays
+
+
+class DynamicMST:
+    """
+    Minimum spanning tree (forest, if the graph is disconnected) that
+    follows edge updates.
+    edges: list of (u, v, w) tuples as for Q8.kruskal; edge i gets id i
+    total_cost: weight of the current tree, kept up to date
+    """
+
+    def __init__(self, edges=()):
+        self.ends = []       # edge id -> (u, v)
+        self.weights = []    # edge id -> w
+        self.incident = {}   # vertex -> set of all edge ids touching it
+        self.tree_adj = {}   # vertex -> {tree edge id: other end}
+        self.in_tree = set()
+        self.total_cost = 0
+
+        labels, us, vs, ws = intern_edges(edges)
+        for u, v, w in zip(us, vs, ws):
+            self._add(labels[u], labels[v], w)
+        mst, _ = kruskal_arrays(us, vs, ws, len(labels))
+        for e in mst:
+            self._link(e)
+
+    # ----- queries -----
+
+    def __len__(self):
+        return len(self.ends)
+
+    def mst_edges(self):
+        """Current tree edges (u, v, w) in the order kruskal() reports them."""
+        return [(*self.ends[e], self.weights[e]) for e in sorted(self.in_tree, key=self._key)]
+
+    def edges(self):
+        """All current edges (u, v, w) by edge id (input for a full rebuild)."""
+        return [(u, v, w) for (u, v), w in zip(self.ends, self.weights)]
+
+    def find_edge(self, u, v):
+        """Id of the lightest edge between u and v, or None."""
+        best = None
+        for e in self.incident.get(u, ()):
+            if self.ends[e] in ((u, v), (v, u)):
+                if best is None or self._key(e) < self._key(best):
+                    best = e
+        return best
+
+    # ----- updates -----
+
+    def insert_edge(self, u, v, w):
+        """Add edge (u, v, w); returns its edge id."""
+        e = self._add(u, v, w)
+        self._offer(e)
+        return e
+
+    def update_weight(self, edge_id, w):
+        """Change the weight of an existing edge (up or down)."""
+        old = self.weights[edge_id]
+        self.weights[edge_id] = w
+        if edge_id in self.in_tree:
+            self.total_cost += w - old
+            if w > old:
+                self._replace(edge_id)
+        elif w < old:
+            self._offer(edge_id)
+
+    # ----- internals -----
+
+    def _key(self, e):
+        return self.weights[e], e
+
+    def _add(self, u, v, w):
+        e = len(self.ends)
+        self.ends.append((u, v))
+        self.weights.append(w)
+        for x in (u, v):
+            if x not in self.incident:
+                self.incident[x] = set()
+                self.tree_adj[x] = {}
+            self.incident[x].add(e)
+        return e
+
+    def _link(self, e):
+        u, v = self.ends[e]
+        self.tree_adj[u][e] = v
+        self.tree_adj[v][e] = u
+        self.in_tree.add(e)
+        self.total_cost += self.weights[e]
+
+    def _cut(self, e):
+        u, v = self.ends[e]
+        del self.tree_adj[u][e]
+        del self.tree_adj[v][e]
+        self.in_tree.discard(e)
+        self.total_cost -= self.weights[e]
+
+    def _tree_path(self, u, v):
+        """Edge ids on the tree path from u to v, or None if not connected."""
+        if u == v:
+            return []
+        parent = {u: None}
+        queue = deque([u])
+        while queue:
+            x = queue.popleft()
+            for e, y in self.tree_adj[x].items():
+                if y in parent:
+                    continue
+                parent[y] = (x, e)
+                if y == v:
+                    path = []
+                    while parent[y] is not None:
+                        y, e = parent[y]
+                        path.append(e)
+                    return path
+                queue.append(y)
+        return None
+
+    def _offer(self, e):
+        """Non-tree edge e: swap it in if it beats the heaviest edge on its cycle."""
+        u, v = self.ends[e]
+        if u == v:
+            return  # a self-loop never joins the tree
+        path = self._tree_path(u, v)
+        if path is None:
+            self._link(e)  # joins two trees of the forest
+            return
+        heaviest = max(path, key=self._key)
+        if self._key(e) < self._key(heaviest):
+            self._cut(heaviest)
+            self._link(e)
+
+    def _smaller_side(self, u, v):
+        """After a cut between u and v: vertex set of the smaller half."""
+        seen = ({u}, {v})
+        queues = ([u], [v])
+        pos = [0, 0]
+        while True:
+            for s in (0, 1):
+                queue = queues[s]
+                if pos[s] == len(queue):
+                    return seen[s]  # this half is fully explored
+                x = queue[pos[s]]
+                pos[s] += 1
+                for y in self.tree_adj[x].values():
+                    if y not in seen[s]:
+                        seen[s].add(y)
+                        queue.append(y)
+
+    def _replace(self, e):
+        """Tree edge e got heavier: reconnect its cut with the lightest crossing edge."""
+        u, v = self.ends[e]
+        self._cut(e)
+        side = self._smaller_side(u, v)
+        best = e
+        for x in side:
+            for f in self.incident[x]:
+                if f in self.in_tree:
+                    continue
+                a, b = self.ends[f]
+                if (a in side) != (b in side) and self._key(f) < self._key(best):
+                    best = f
+        self._link(best)
+
+
+# ---------- Benchmark ----------
+
+def benchmark(n=20000, m=200000, updates=2000, seed=0):
+    """
+    Average latency of DynamicMST updates on a random stream (inserts,
+    weight decreases and increases, on tree and non-tree edges) against
+    one full rebuild with Q8.kruskal / Q8.kruskal_fast.
+    """
+    import random
+    import time
+    from Q8 import kruskal, kruskal_fast, random_edges
+
+    rng = random.Random(seed)
+    edges = random_edges(n, m, seed)
+    t0 = time.perf_counter()
+    dyn = DynamicMST(edges)
+    build = time.perf_counter() - t0
+
+    counts = {"insert": 0, "decrease": 0, "increase": 0}
+    t0 = time.perf_counter()
+    for _ in range(updates):
+        op = rng.choice(("insert", "decrease", "increase"))
+        counts[op] += 1
+        if op == "insert":
+            dyn.insert_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 1000))
+        else:
+            # half of the weight changes hit tree edges
+            if rng.random() < 0.5:
+                e = rng.choice(tuple(dyn.in_tree))
+            else:
+                e = rng.randrange(len(dyn))
+            w = dyn.weights[e]
+            dyn.update_weight(e, max(1, w - rng.randint(1, 500)) if op == "decrease"
+                              else w + rng.randint(1, 500))
+    per_update = (time.perf_counter() - t0) / updates
+
+    current = dyn.edges()
+    t0 = time.perf_counter()
+    expected, cost = kruskal(current)
+    rebuild = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    kruskal_fast(current)
+    rebuild_fast = time.perf_counter() - t0
+    assert dyn.mst_edges() == expected and dyn.total_cost == cost
+
+    print(f"graph: {n} vertices, {len(current)} edges after {updates} updates {counts}")
+    print(f"initial build:          {build * 1000:10.2f} ms")
+    print(f"kruskal rebuild:        {rebuild * 1000:10.2f} ms")
+    print(f"kruskal_fast rebuild:   {rebuild_fast * 1000:10.2f} ms")
+    print(f"DynamicMST per update:  {per_update * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    example_edges = [
+        (0, 1, 4), (0, 7, 8), (1, 7, 11), (1, 2, 8), (7, 8, 7), (7, 6, 1),
+        (2, 8, 2), (8, 6, 6), (2, 3, 7), (2, 5, 4), (6, 5, 2), (3, 5, 14),
+        (3, 4, 9), (4, 5, 10)
+    ]
+    mst = DynamicMST(example_edges)
+    print("Total MST cost:", mst.total_cost)
+    mst.insert_edge(3, 4, 1)                      # replaces (3, 4, 9)
+    print("After inserting (3, 4, 1):", mst.total_cost)
+    mst.update_weight(mst.find_edge(7, 6), 20)    # (7, 6) leaves the tree
+    print("After raising (7, 6) to 20:", mst.total_cost)
+    print("MST edges:", mst.mst_edges())
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
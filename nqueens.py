@@ -0,0 +1,323 @@
+'''Bitboard n-queens engine (fast counterpart of Q4/Q5 solve_n_queens).'''
+# The sets cols / diag1 / diag2 of Q4/Q5 become three integers used as bit
+# masks for the current row:
+#   cols: bit c set  -> column c is taken
+#   ld:   bit c set  -> (row, c) is attacked along a "\" diagonal
+#   rd:   bit c set  -> (row, c) is attacked along a "/" diagonal
+# Moving to the next row shifts ld left and rd right by one. The free columns
+# of a row are then simply  full & ~(cols | ld | rd).
+# Bits are taken lowest first, i.e. columns in increasing order, so solutions
+# come out in the same (lexicographic) order as solve_n_queens.
+
+
+def _count_from(full, cols, ld, rd):
+    """Number of ways to complete the board from the given masks."""
+    if cols == full:
+        return 1
+    total = 0
+    avail = full & ~(cols | ld | rd)
+    while avail:
+        bit = avail & -avail   # lowest free column
+        avail ^= bit
+        total += _count_from(full, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+    return total
+
+
+def _iter_from(n, cols, ld, rd, prefix):
+    """
+    Generator of all completions of `prefix` (columns of the first rows),
+    in lexicographic order, using an explicit stack instead of recursion.
+    """
+    full = (1 << n) - 1
+    if len(prefix) == n:
+        yield list(prefix)
+        return
+
+    partial = list(prefix)
+    depth0 = len(prefix)
+    masks = [(cols, ld, rd)]
+    avails = [full & ~(cols | ld | rd)]
+    while avails:
+        avail = avails[-1]
+        if not avail:
+            # this row is exhausted: backtrack to the previous one
+            avails.pop()
+            masks.pop()
+            if len(partial) > depth0:
+                partial.pop()
+            continue
+
+        bit = avail & -avail
+        avails[-1] = avail ^ bit
+        c, l, r = masks[-1]
+        partial.append(bit.bit_length() - 1)
+        if len(partial) == n:
+            yield list(partial)
+            partial.pop()
+            continue
+        c, l, r = c | bit, ((l | bit) << 1) & full, (r | bit) >> 1
+        masks.append((c, l, r))
+        avails.append(full & ~(c | l | r))
+
+
+def _first_row(n, c):
+    """Masks after placing the row-0 queen in column c."""
+    bit = 1 << c
+    full = (1 << n) - 1
+    return bit, (bit << 1) & full, bit >> 1
+
+
+def count_n_queens(n, symmetry=True):
+    """
+    Count n-queens solutions without storing any of them.
+    symmetry: use the left-right mirror: a solution with its first queen in
+              column c mirrors to one with the first queen in column n-1-c,
+              so only the left half of row 0 is searched (plus the middle
+              column for odd n).
+    """
+    if n == 0:
+        return 1
+    full = (1 << n) - 1
+    if not symmetry:
+        return _count_from(full, 0, 0, 0)
+
+    total = 0
+    for c in range(n // 2):
+        total += 2 * _count_from(full, *_first_row(n, c))
+    if n % 2 == 1:
+        total += _count_from(full, *_first_row(n, n // 2))
+    return total
+
+
+def iter_n_queens(n, symmetry=True):
+    """
+    Stream solutions one by one (each a list, solution[row] = column).
+    symmetry=False: lexicographic order, exactly like solve_n_queens.
+    symmetry=True:  only half of the tree is searched; every solution from
+                    the left half is followed by its mirror image, so the
+                    set of solutions is the same but the order differs.
+    """
+    if n == 0:
+        yield []
+        return
+    if not symmetry:
+        yield from _iter_from(n, 0, 0, 0, [])
+        return
+
+    for c in range(n // 2):
+        for solution in _iter_from(n, *_first_row(n, c), [c]):
+            yield solution
+            yield [n - 1 - col for col in solution]
+    if n % 2 == 1:
+        yield from _iter_from(n, *_first_row(n, n // 2), [n // 2])
+
+
+def first_n_queens(n):
+    """First solution in lexicographic order, or None if there is none."""
+    return next(_iter_from(n, 0, 0, 0, []), None)
+
+
+def all_n_queens(n):
+    """
+    All solutions as a list, identical (same order) to solve_n_queens(n).
+    Only the left half of row 0 is searched; the right half is filled with
+    mirror images. Mirroring reverses lexicographic order, so the solutions
+    starting in column n-1-c are the mirrored column-c group read backwards.
+    """
+    if n == 0:
+        return [[]]
+    groups = [list(_iter_from(n, *_first_row(n, c), [c])) for c in range(n // 2)]
+    solutions = []
+    for group in groups:
+        solutions.extend(group)
+    if n % 2 == 1:
+        solutions.extend(_iter_from(n, *_first_row(n, n // 2), [n // 2]))
+    for group in reversed(groups):
+        solutions.extend([n - 1 - col for col in s] for s in reversed(group))
+    return solutions
+
+
+# ---------- Parallel search ----------
+# The tree is cut after the first `prefix_rows` rows: every legal placement
+# of those rows is an independent subproblem (a prefix plus its masks).
+# Subproblems are handed to a multiprocessing pool one at a time
+# (chunksize=1), so idle workers keep pulling the next one -- the pool's
+# task queue acts as a simple work-stealing scheme for uneven subtrees.
+
+def _prefix_tasks(n, prefix_rows, symmetry):
+    """
+    List of (prefix, cols, ld, rd, weight) subproblems in lexicographic
+    order. With symmetry only the left half of row 0 (+ middle) is used and
+    weight says how many solutions each completion stands for.
+    """
+    full = (1 << n) - 1
+    first_cols = range((n + 1) // 2) if symmetry else range(n)
+    tasks = []
+    for c in first_cols:
+        weight = 1 if (not symmetry or (n % 2 == 1 and c == n // 2)) else 2
+        stack = [([c], *_first_row(n, c))]
+        level = []
+        while stack:
+            prefix, cols, ld, rd = stack.pop()
+            if len(prefix) >= prefix_rows or len(prefix) == n:
+                level.append((prefix, cols, ld, rd, weight))
+                continue
+            avail = full & ~(cols | ld | rd)
+            children = []
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                children.append((prefix + [bit.bit_length() - 1], cols | bit,
+                                 ((ld | bit) << 1) & full, (rd | bit) >> 1))
+            stack.extend(reversed(children))  # pop in increasing column order
+        tasks.extend(level)
+    return tasks
+
+
+def _default_prefix_rows(n, workers):
+    # enough subproblems that every worker gets ~16 of them
+    rows = 1
+    while rows < n and n ** rows < 16 * workers:
+        rows += 1
+    return min(rows, max(n - 1, 1))
+
+
+def _count_task(args):
+    n, prefix, cols, ld, rd, weight = args
+    return weight * _count_from((1 << n) - 1, cols, ld, rd)
+
+
+def _solutions_task(args):
+    n, prefix, cols, ld, rd, _ = args
+    return list(_iter_from(n, cols, ld, rd, prefix))
+
+
+def _first_task(args):
+    n, prefix, cols, ld, rd, _ = args
+    return next(_iter_from(n, cols, ld, rd, prefix), None)
+
+
+def _run_tasks(n, workers, prefix_rows, symmetry, task, ordered):
+    """Yield task results from a pool (or in-process for workers=1)."""
+    import os
+    from multiprocessing import Pool
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if prefix_rows is None:
+        prefix_rows = _default_prefix_rows(n, workers)
+    tasks = [(n, *t) for t in _prefix_tasks(n, prefix_rows, symmetry)]
+    if workers == 1:
+        yield from map(task, tasks)
+        return
+    with Pool(workers) as pool:
+        results = pool.imap if ordered else pool.imap_unordered
+        yield from results(task, tasks, chunksize=1)
+    # leaving the with-block terminates the pool, which also cancels
+    # outstanding subproblems when the caller stops early
+
+
+def count_n_queens_parallel(n, workers=None, prefix_rows=None):
+    """
+    count_n_queens on a process pool: subproblems are the placements of
+    the first `prefix_rows` rows (mirror symmetry on row 0 is kept).
+    workers: number of processes (default os.cpu_count(); 1 = no pool)
+    """
+    if n == 0:
+        return 1
+    return sum(_run_tasks(n, workers, prefix_rows, True, _count_task, False))
+
+
+def iter_n_queens_parallel(n, workers=None, prefix_rows=None):
+    """
+    Stream all solutions computed on a process pool. Subproblem results are
+    merged in prefix order, so the output is deterministic and identical to
+    solve_n_queens / iter_n_queens(n, symmetry=False).
+    """
+    if n == 0:
+        yield []
+        return
+    for solutions in _run_tasks(n, workers, prefix_rows, False, _solutions_task, True):
+        yield from solutions
+
+
+def first_n_queens_parallel(n, workers=None, prefix_rows=None):
+    """
+    Decision variant: return some solution as soon as any worker finds one
+    and cancel the remaining subproblems (None if there is no solution).
+    The solution returned is not necessarily the lexicographically first.
+    """
+    if n == 0:
+        return []
+    results = _run_tasks(n, workers, prefix_rows, False, _first_task, False)
+    try:
+        for solution in results:
+            if solution is not None:
+                return solution
+        return None
+    finally:
+        results.close()  # terminates the pool right away
+
+
+# ---------- Benchmark ----------
+
+def benchmark(sizes=range(8, 17), max_reference_n=12, max_stream_n=14):
+    """
+    Table of solution counts and times for n in `sizes`:
+    the set-based solve_n_queens (only up to max_reference_n, it is slow),
+    count_n_queens and streaming through iter_n_queens (up to max_stream_n).
+    """
+    import time
+    from Q5 import solve_n_queens
+
+    def timed(func):
+        t0 = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - t0
+
+    print(f"{'n':>3}{'solutions':>11}{'sets (s)':>10}{'count (s)':>11}{'stream (s)':>12}")
+    for n in sizes:
+        if n <= max_reference_n:
+            reference, ref_time = timed(lambda: solve_n_queens(n))
+            assert all_n_queens(n) == reference
+            ref_col = f"{ref_time:.3f}"
+        else:
+            ref_col = "-"
+        count, count_time = timed(lambda: count_n_queens(n))
+        if n <= max_stream_n:
+            streamed, stream_time = timed(lambda: sum(1 for _ in iter_n_queens(n)))
+            assert streamed == count
+            stream_col = f"{stream_time:.3f}"
+        else:
+            stream_col = "-"
+        print(f"{n:>3}{count:>11}{ref_col:>10}{count_time:>11.3f}{stream_col:>12}")
+
+
+def benchmark_parallel(n=13, worker_counts=None):
+    """Speedup of count_n_queens_parallel over 1..cpu_count workers."""
+    import os
+    import time
+
+    if worker_counts is None:
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1))) or [1]
+    print(f"n = {n}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'count':>10}{'seconds':>10}{'speedup':>9}")
+    base = None
+    for workers in worker_counts:
+        t0 = time.perf_counter()
+        count = count_n_queens_parallel(n, workers)
+        elapsed = time.perf_counter() - t0
+        base = base or elapsed
+        print(f"{workers:>8}{count:>10}{elapsed:>10.3f}{base / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    n = 8
+    print(f"Number of solutions for n={n}: {count_n_queens(n)}")
+    print("First solution:", first_n_queens(n))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_parallel()
@@ -0,0 +1,347 @@
+'''Repeated A* queries on a static grid: hierarchical abstraction (HPA*) + LRU cache.'''
+# The grid (same format as Q3: 0 = free, 1 = obstacle, 4-directional unit
+# moves) is cut into square clusters. Along every border between two
+# clusters, each run of cells that is free on both sides becomes an
+# "entrance" with one or two transition cells. Transition cells are the
+# nodes of a small abstract graph:
+#   - inter edges (cost 1) cross a border between the two transition cells
+#   - intra edges connect the transition cells of one cluster, with the
+#     shortest distance inside that cluster as cost
+# A query connects start and goal to the nodes of their clusters, searches
+# the abstract graph and then refines every abstract edge into grid cells.
+# Paths are valid and near-optimal (not always optimal, like HPA*).
+
+import heapq
+from collections import OrderedDict, deque
+
+from Q3 import a_star, heuristic, random_grid
+
+
+class GridPathfinder:
+    """
+    Preprocessed grid for many path queries.
+    grid: list of rows (0 = free, 1 = obstacle); copied, change it with set_cell
+    cluster_size: side of the square clusters
+    cache_size: number of (start, goal) results kept in the LRU cache
+    """
+
+    def __init__(self, grid, cluster_size=16, cache_size=1024):
+        self.grid = [list(row) for row in grid]
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.cluster_size = cluster_size
+        self.cache_size = cache_size
+        self.cache = OrderedDict()   # (start, goal) -> path or None
+        self.hits = 0
+        self.misses = 0
+
+        self._borders = {}    # border key -> list of (cell, cell) transitions
+        self._inter = {}      # cell -> set of cells across a border
+        self._intra = {}      # cluster -> {node: {node: distance}}
+        self._segments = {}   # cluster -> {(a, b): refined local path}
+
+        crows = (self.rows + cluster_size - 1) // cluster_size
+        ccols = (self.cols + cluster_size - 1) // cluster_size
+        for cr in range(crows):
+            for cc in range(ccols):
+                if cc + 1 < ccols:
+                    self._scan_border(("h", cr, cc))
+                if cr + 1 < crows:
+                    self._scan_border(("v", cr, cc))
+        for cr in range(crows):
+            for cc in range(ccols):
+                self._build_cluster((cr, cc))
+
+    # ---------- preprocessing ----------
+
+    def cluster_of(self, cell):
+        return (cell[0] // self.cluster_size, cell[1] // self.cluster_size)
+
+    def _free(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols and self.grid[r][c] == 0
+
+    def _border_pairs(self, key):
+        """All (cell, cell) pairs facing each other across a border."""
+        kind, cr, cc = key
+        size = self.cluster_size
+        if kind == "h":   # between cluster (cr, cc) and (cr, cc + 1)
+            c = (cc + 1) * size - 1
+            return [((r, c), (r, c + 1))
+                    for r in range(cr * size, min((cr + 1) * size, self.rows))]
+        r = (cr + 1) * size - 1   # "v": between (cr, cc) and (cr + 1, cc)
+        return [((r, c), (r + 1, c))
+                for c in range(cc * size, min((cc + 1) * size, self.cols))]
+
+    def _scan_border(self, key):
+        """(Re)compute the transitions of one border and update the inter edges."""
+        for a, b in self._borders.get(key, []):
+            self._inter[a].discard(b)
+            self._inter[b].discard(a)
+
+        transitions = []
+        run = []
+        for a, b in self._border_pairs(key) + [(None, None)]:
+            if a is not None and self._free(*a) and self._free(*b):
+                run.append((a, b))
+                continue
+            if run:
+                # short entrances get one transition in the middle,
+                # long ones get one at each end
+                if len(run) < 6:
+                    transitions.append(run[len(run) // 2])
+                else:
+                    transitions.append(run[0])
+                    transitions.append(run[-1])
+                run = []
+
+        self._borders[key] = transitions
+        for a, b in transitions:
+            self._inter.setdefault(a, set()).add(b)
+            self._inter.setdefault(b, set()).add(a)
+
+    def _cluster_borders(self, cluster):
+        cr, cc = cluster
+        return [("h", cr, cc - 1), ("h", cr, cc), ("v", cr - 1, cc), ("v", cr, cc)]
+
+    def _cluster_nodes(self, cluster):
+        nodes = set()
+        for key in self._cluster_borders(cluster):
+            for a, b in self._borders.get(key, []):
+                nodes.add(a if self.cluster_of(a) == cluster else b)
+        return nodes
+
+    def _local_bfs(self, source, cluster, target=None):
+        """
+        BFS from `source` that never leaves `cluster`, stopping early once
+        `target` is reached (if given); returns (dist, parent).
+        """
+        size = self.cluster_size
+        r0, c0 = cluster[0] * size, cluster[1] * size
+        r1, c1 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+        grid = self.grid
+        dist = {source: 0}
+        parent = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                break
+            r, c = node
+            d = dist[node] + 1
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if r0 <= nr < r1 and c0 <= nc < c1 and grid[nr][nc] == 0:
+                    nxt = (nr, nc)
+                    if nxt not in dist:
+                        dist[nxt] = d
+                        parent[nxt] = node
+                        queue.append(nxt)
+        return dist, parent
+
+    def _build_cluster(self, cluster):
+        """Intra edges: in-cluster distances between the cluster's nodes."""
+        nodes = self._cluster_nodes(cluster)
+        edges = {}
+        for node in nodes:
+            dist, _ = self._local_bfs(node, cluster)
+            edges[node] = {other: dist[other] for other in nodes
+                           if other != node and other in dist}
+        self._intra[cluster] = edges
+        self._segments[cluster] = {}
+
+    # ---------- updates ----------
+
+    def set_cell(self, cell, blocked=True):
+        """
+        Block (blocked=True) or free one cell without a full rebuild: only
+        the four borders of its cluster are rescanned and the intra edges of
+        that cluster and its neighbors recomputed.
+        Cached results are invalidated: blocking drops the cached paths
+        through the cell, freeing drops the whole cache (paths may get shorter).
+        """
+        r, c = cell
+        value = 1 if blocked else 0
+        if self.grid[r][c] == value:
+            return
+        self.grid[r][c] = value
+
+        if blocked:
+            stale = [key for key, path in self.cache.items()
+                     if path is not None and cell in path]
+            for key in stale:
+                del self.cache[key]
+        else:
+            self.cache.clear()
+
+        cluster = self.cluster_of(cell)
+        for key in self._cluster_borders(cluster):
+            if key in self._borders:
+                self._scan_border(key)
+        cr, cc = cluster
+        for nearby in (cluster, (cr - 1, cc), (cr + 1, cc), (cr, cc - 1), (cr, cc + 1)):
+            if nearby in self._intra:
+                self._build_cluster(nearby)
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    # ---------- queries ----------
+
+    def find_path(self, start, goal):
+        """
+        Path from start to goal in the same format as Q3.a_star
+        (list of cells including both ends), or None if there is none.
+        """
+        key = (start, goal)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            path = self.cache[key]
+            return None if path is None else list(path)
+
+        self.misses += 1
+        path = self._search(start, goal)
+        self.cache[key] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return None if path is None else list(path)
+
+    def _search(self, start, goal):
+        if not self._free(*start) or not self._free(*goal):
+            return None
+        if start == goal:
+            return [start]
+
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        start_dist, _ = self._local_bfs(start, start_cluster)
+        goal_dist, _ = self._local_bfs(goal, goal_cluster)
+        start_links = {node: start_dist[node] for node in self._intra[start_cluster]
+                       if node in start_dist and node != start}
+        goal_links = {node: goal_dist[node] for node in self._intra[goal_cluster]
+                      if node in goal_dist and node != goal}
+        if start_cluster == goal_cluster and goal in start_dist:
+            start_links[goal] = start_dist[goal]
+
+        def neighbors(node):
+            edges = dict(self._intra[self.cluster_of(node)].get(node, {}))
+            if node == start:
+                edges.update(start_links)
+            for other in self._inter.get(node, ()):
+                edges[other] = 1
+            if node in goal_links:
+                edges[goal] = min(edges.get(goal, float('inf')), goal_links[node])
+            return edges.items()
+
+        # A* on the abstract graph
+        g = {start: 0}
+        came_from = {}
+        closed = set()
+        open_heap = [(heuristic(start, goal), start)]
+        while open_heap:
+            _, node = heapq.heappop(open_heap)
+            if node in closed:
+                continue
+            if node == goal:
+                break
+            closed.add(node)
+            for other, cost in neighbors(node):
+                tentative_g = g[node] + cost
+                if other not in closed and tentative_g < g.get(other, float('inf')):
+                    g[other] = tentative_g
+                    came_from[other] = node
+                    heapq.heappush(open_heap, (tentative_g + heuristic(other, goal), other))
+        if goal not in g:
+            return None
+
+        abstract = [goal]
+        while abstract[-1] in came_from:
+            abstract.append(came_from[abstract[-1]])
+        abstract.reverse()
+        return self._refine(abstract)
+
+    def _refine(self, abstract):
+        """Turn a list of abstract nodes into the full list of grid cells."""
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            cluster = self.cluster_of(a)
+            if cluster != self.cluster_of(b):
+                path.append(b)  # inter edge: b is the next cell across the border
+                continue
+            segments = self._segments[cluster]
+            segment = segments.get((a, b))
+            if segment is None:
+                _, parent = self._local_bfs(a, cluster, target=b)
+                segment = [b]
+                while parent[segment[-1]] is not None:
+                    segment.append(parent[segment[-1]])
+                segment.reverse()
+                # only segments between abstract nodes are reused;
+                # start/goal segments change with every query
+                if a in self._intra[cluster] and b in self._intra[cluster]:
+                    segments[(a, b)] = segment
+            path.extend(segment[1:])
+        return path
+
+
+# ---------- Benchmark ----------
+
+def benchmark(size=256, density=0.2, queries=2000, distinct=200, seed=0):
+    """
+    Queries/sec of plain a_star (heap mode) vs GridPathfinder, without and
+    with the LRU cache, on `queries` queries drawn from `distinct` random
+    (start, goal) pairs. Also reports the average path-length overhead.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    grid = random_grid(size, size, density, seed)
+    free_cells = [(r, c) for r in range(size) for c in range(size) if grid[r][c] == 0]
+    pairs = [(rng.choice(free_cells), rng.choice(free_cells)) for _ in range(distinct)]
+    workload = [rng.choice(pairs) for _ in range(queries)]
+
+    t0 = time.perf_counter()
+    finder = GridPathfinder(grid)
+    build = time.perf_counter() - t0
+    print(f"grid {size}x{size}, preprocessing {build:.3f} s, "
+          f"{sum(len(n) for n in finder._intra.values())} abstract nodes")
+
+    sample = workload[:200]
+    t0 = time.perf_counter()
+    optimal = [a_star(grid, s, g, mode="heap") for s, g in sample]
+    plain_rate = len(sample) / (time.perf_counter() - t0)
+
+    uncached = GridPathfinder(grid, cache_size=0)
+    t0 = time.perf_counter()
+    hierarchical = [uncached.find_path(s, g) for s, g in sample]
+    hpa_rate = len(sample) / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for s, g in workload:
+        finder.find_path(s, g)
+    cached_rate = len(workload) / (time.perf_counter() - t0)
+
+    found = [(len(h), len(o)) for h, o in zip(hierarchical, optimal) if o]
+    overhead = sum(h / o for h, o in found) / len(found) - 1 if found else 0.0
+    print(f"{'method':<22}{'queries/s':>12}")
+    print(f"{'a_star (heap)':<22}{plain_rate:>12.1f}")
+    print(f"{'hierarchical':<22}{hpa_rate:>12.1f}")
+    print(f"{'hierarchical + cache':<22}{cached_rate:>12.1f}")
+    print(f"path length overhead: {overhead:.2%}, cache hits {finder.hits}/{len(workload)}")
+
+
+if __name__ == "__main__":
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 1, 0],
+        [0, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+    ]
+    finder = GridPathfinder(grid, cluster_size=2)
+    print("Path found:", finder.find_path((0, 0), (4, 4)))
+    finder.set_cell((4, 1))
+    print("After blocking (4, 1):", finder.find_path((0, 0), (4, 4)))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark()